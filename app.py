@@ -1,15 +1,25 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
+import pyarrow as pa
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 import datetime
-import json
 import os
+import io
+import re
 import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import orjson
+
+# Serialize Plotly figures with orjson
+pio.json.config.default_engine = "orjson"
 
 # Import custom modules
-import vector_processing
 from auth_db import auth_page, is_authenticated, get_current_user, require_auth
 import ai_agents
 import db_service as db
@@ -17,7 +27,6 @@ import vector_processing as vp
 import finance_agent
 from finance_agent import FinanceAgent
 from fetch_agents import start_agents, stop_agents, analyze_transaction, get_financial_insights, answer_query
-from budget import budget_management_page
 from visualization import (
     create_balance_chart, 
     create_spending_by_category_chart, 
@@ -43,16 +52,11 @@ from utils.custom_style import (
     badge,
     neon_text,
     retro_metric,
+    retro_metric_grid,
     animated_progress,
     retro_table
 )
-import quantitative_finance
-from finance_quiz import finance_quiz_page
 from visualization_tabs import create_tabbed_charts
-from credit_management import credit_management_page
-from financial_coaching import financial_coaching_page
-from crypto_finance import crypto_finance_page
-from finance_rag_ui import finance_rag_page
 
 # Check for required API keys with retry mechanism
 def get_api_key():
@@ -80,7 +84,402 @@ except Exception as e:
     print(f"Failed to initialize services: {str(e)}")
 
 # Create finance agent singleton
-finance_agent = FinanceAgent()
+@st.cache_resource
+def get_finance_agent():
+    """Return the finance agent shared across sessions and reruns; call for_user on it, never set_user."""
+    return FinanceAgent()
+
+finance_agent = get_finance_agent()
+
+# Long-lived event loop for agent coroutines, shared across sessions and reruns
+@st.cache_resource
+def get_background_loop():
+    """Return the event loop running in a daemon thread for agent work."""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return loop
+
+def run_async(coro):
+    """Schedule a coroutine on the background loop and return its future."""
+    return asyncio.run_coroutine_threadsafe(coro, get_background_loop())
+
+def analyze_transaction_in_background(user_id, transaction_id):
+    """Queue agent analysis of a new transaction without blocking the UI."""
+    return run_async(analyze_transaction(user_id, transaction_id))
+
+async def _enrich_transaction(user_id, transaction_id, description):
+    """Categorize, index, and analyze a quick-added transaction."""
+    category = await asyncio.to_thread(finance_agent.categorize_transaction, description)
+    transaction = await asyncio.to_thread(db.update_transaction, transaction_id, {"category": category})
+    if transaction:
+        # Let every session refetch the recategorized transaction
+        invalidate_user_data(user_id)
+        await asyncio.to_thread(vp.process_new_transaction, transaction.to_dict())
+    await analyze_transaction(user_id, transaction_id)
+
+def enrich_transaction_in_background(user_id, transaction_id, description):
+    """Queue AI enrichment of a quick-added transaction without blocking the UI."""
+    return run_async(_enrich_transaction(user_id, transaction_id, description))
+
+# Financial health gauge, built on first use; only the score changes per render
+@st.cache_resource
+def get_health_gauge_template():
+    """Return the shared financial health gauge figure template."""
+    template = go.Figure(go.Indicator(
+        mode = "gauge+number",
+        value = 0,
+        domain = {'x': [0, 1], 'y': [0, 1]},
+        title = {'text': "Financial Health Score"},
+        gauge = {
+            'axis': {'range': [0, 100]},
+            'bar': {'color': "#4F8BF9"},
+            'steps' : [
+                {'range': [0, 40], 'color': "#FF5722"},
+                {'range': [40, 60], 'color': "#FF9800"},
+                {'range': [60, 80], 'color': "#8BC34A"},
+                {'range': [80, 100], 'color': "#4CAF50"}
+            ],
+            'threshold': {
+                'line': {'color': "white", 'width': 4},
+                'thickness': 0.75,
+                'value': 0
+            }
+        }
+    ))
+    template.update_layout(height=300, margin=dict(l=10, r=10, t=50, b=10))
+    return template
+
+# Cached data loaders
+@st.cache_data(ttl=30, show_spinner=False)
+def check_db_connection():
+    """Return None if the database is reachable, otherwise the error message."""
+    try:
+        db.get_db().close()
+        return None
+    except Exception as e:
+        return str(e)
+
+# Per-user data versions shared by every session, so cache keys track the stored data
+@st.cache_resource
+def _get_data_versions():
+    """Return the server-wide per-user data version counters and their lock."""
+    return {}, threading.Lock()
+
+def get_txn_version(user_id):
+    """Return the user's data version, used as a cache key."""
+    versions, lock = _get_data_versions()
+    with lock:
+        return versions.get(user_id, 0)
+
+def invalidate_user_data(user_id):
+    """Bump the user's data version so every session's cached loaders refetch."""
+    versions, lock = _get_data_versions()
+    with lock:
+        versions[user_id] = versions.get(user_id, 0) + 1
+
+def invalidate_goal_data(user_id):
+    """Bump the data version after a goal write, keeping this session's patched goal list current."""
+    invalidate_user_data(user_id)
+    st.session_state.goals_cache_key = (user_id, get_txn_version(user_id))
+
+# Client-side formatting for transaction tables
+TRANSACTION_COLUMN_CONFIG = {
+    "Date": st.column_config.DateColumn("Date", format="MMM DD, YYYY"),
+    "Amount": st.column_config.NumberColumn("Amount", format="$%.2f")
+}
+
+@st.cache_data(ttl=300, show_spinner=False)
+def get_txn_dicts(user_id, txn_version):
+    """Return the user's transactions as dictionaries, cached per data version."""
+    return list(db.iter_transaction_dicts(user_id))
+
+LIGHT_TXN_FIELDS = ("id", "date", "description", "amount", "category")
+
+@st.cache_data(ttl=300, show_spinner=False)
+def get_light_txn_dicts(user_id, txn_version):
+    """Return only the transaction fields the assistant page displays, cached per data version."""
+    return [
+        {field: getattr(t, field) for field in LIGHT_TXN_FIELDS}
+        for t in db.get_transactions(user_id)
+    ]
+
+def get_goal_dicts(user_id):
+    """Return the user's goals from the session, reloading them after a data change."""
+    cache_key = (user_id, get_txn_version(user_id))
+    if st.session_state.get("goals_cache_key") != cache_key:
+        st.session_state.goals_cache = [g.to_dict() for g in db.get_goals(user_id)]
+        st.session_state.goals_cache_key = cache_key
+    return st.session_state.goals_cache
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _load_dashboard(user_id, txn_version):
+    return {
+        "txns": get_txn_dicts(user_id, txn_version),
+        "balance": db.calculate_balance(user_id),
+        "summary": db.get_transaction_summary(user_id),
+        "category": db.get_category_spending(user_id)
+    }
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_agent_call(method_name, user_id, txn_version):
+    return getattr(finance_agent.for_user(user_id), method_name)()
+
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def _cached_category_chart(category_items):
+    return create_spending_by_category_chart(dict(category_items))
+
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def _cached_balance_chart(balance_rows):
+    return create_balance_chart([
+        {"date": date, "amount": amount, "type": txn_type}
+        for date, amount, txn_type in balance_rows
+    ])
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _build_progress_fig(goal_rows):
+    """Build the goal progress bar chart from (name, target, current) rows."""
+    goal_df = pd.DataFrame(list(goal_rows), columns=["name", "target", "current"])
+    target = goal_df["target"].where(goal_df["target"] > 0)
+    goal_df["percent"] = (goal_df["current"] / target * 100).fillna(0.0)
+    
+    # Create a horizontal bar chart
+    fig = px.bar(
+        goal_df,
+        y="name",
+        x="percent",
+        orientation='h',
+        labels={"name": "Goal", "percent": "Progress (%)"},
+        text="percent",
+        color="percent",
+        color_continuous_scale="Blues",
+        range_x=[0, 100]
+    )
+    
+    # Add text labels
+    fig.update_traces(texttemplate='%{text:.1f}%', textposition='outside')
+    
+    # Add a vertical line at 100%
+    fig.add_vline(x=100, line_dash="dash", line_color="green", annotation_text="Target")
+    
+    # Layout
+    fig.update_layout(
+        title="Goal Progress",
+        yaxis=dict(autorange="reversed"),  # Reverse the order of goals
+        margin=dict(l=20, r=20, t=40, b=20),
+        height=400
+    )
+    
+    return fig
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _build_timeline_fig(goal_rows, today):
+    """Build the goal timeline chart from (name, deadline, target, current) rows."""
+    timeline_df = pd.DataFrame(list(goal_rows), columns=["name", "deadline", "target_amount", "current_amount"])
+    timeline_df["days_left"] = (timeline_df["deadline"] - pd.Timestamp(today)).dt.days.clip(lower=0)
+    timeline_df["status"] = np.where(
+        timeline_df["current_amount"] >= timeline_df["target_amount"], "Completed", "In Progress"
+    )
+    timeline_df["deadline_str"] = timeline_df["deadline"].dt.strftime("%b %d, %Y")
+    timeline_df = timeline_df.sort_values("deadline")
+    
+    # Create a horizontal bar chart
+    fig = px.bar(
+        timeline_df,
+        y="name",
+        x="days_left",
+        orientation='h',
+        labels={"name": "Goal", "days_left": "Days Left"},
+        text="deadline_str",
+        color="status",
+        color_discrete_map={"Completed": "#4CAF50", "In Progress": "#2196F3"}
+    )
+    
+    # Add text labels
+    fig.update_traces(textposition='outside')
+    
+    # Layout
+    fig.update_layout(
+        title="Goal Timeline",
+        yaxis=dict(autorange="reversed"),  # Reverse the order of goals
+        margin=dict(l=20, r=20, t=40, b=20),
+        height=400
+    )
+    
+    return fig
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _rows_to_arrow(rows):
+    """Convert a tuple of (column, value) row tuples to an Arrow table for st.dataframe."""
+    return pa.Table.from_pylist([dict(row) for row in rows])
+
+@st.cache_data(ttl=300, max_entries=16, show_spinner=False)
+def _transactions_csv(user_id, txn_version, filters, _df):
+    """Encode the filtered transaction table as CSV, keyed on the data version and filters rather than the frame."""
+    return _df.to_csv(index=False).encode("utf-8")
+
+# Exports with at least this many transactions are serialized in chunks
+EXPORT_CHUNK_SIZE = 500
+
+def _export_json_bytes(user_info, txn_dicts, goal_dicts, export_date):
+    """Serialize the data export, writing large transaction lists chunk by chunk."""
+    if len(txn_dicts) < EXPORT_CHUNK_SIZE:
+        export_data = {
+            "user_info": user_info,
+            "transactions": txn_dicts,
+            "goals": goal_dicts,
+            "export_date": export_date
+        }
+        return orjson.dumps(export_data, option=orjson.OPT_INDENT_2, default=str)
+    
+    buffer = io.BytesIO()
+    buffer.write(b'{"user_info":' + orjson.dumps(user_info, default=str) + b',"transactions":[')
+    for start in range(0, len(txn_dicts), EXPORT_CHUNK_SIZE):
+        if start:
+            buffer.write(b",")
+        # Strip the brackets so chunks join into one array
+        buffer.write(orjson.dumps(txn_dicts[start:start + EXPORT_CHUNK_SIZE], default=str)[1:-1])
+    buffer.write(b'],"goals":' + orjson.dumps(goal_dicts, default=str))
+    buffer.write(b',"export_date":' + orjson.dumps(export_date, default=str) + b"}")
+    return buffer.getvalue()
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_ai_text(method_name, user_id, txn_version):
+    return getattr(finance_agent.for_user(user_id), method_name)()
+
+# Session cache of answered questions, matched exactly or by embedding similarity
+QA_CACHE_SIZE = 100
+QA_SIMILARITY_THRESHOLD = 0.95
+# Words that pin a question to a period or amount; similar questions must share them
+QA_PERIOD_TERMS = re.compile(
+    r"\b(today|yesterday|tomorrow|this|last|next|past|previous|current|"
+    r"days?|weeks?|weekly|months?|monthly|quarters?|years?|yearly|annual|ytd|"
+    r"jan(uary)?|feb(ruary)?|mar(ch)?|apr(il)?|may|june?|july?|aug(ust)?|"
+    r"sep(t(ember)?)?|oct(ober)?|nov(ember)?|dec(ember)?|\d+)\b"
+)
+
+def _qa_cache_scope(user_id):
+    """Return the (user, data version) pair that cached answers are valid for."""
+    return (user_id, get_txn_version(user_id))
+
+def _get_qa_cache(user_id):
+    """Return the session's answer cache, dropping entries from older data versions."""
+    cache = st.session_state.setdefault("qa_cache", OrderedDict())
+    scope = _qa_cache_scope(user_id)
+    for stale_key in [k for k in cache if k[0] != scope]:
+        del cache[stale_key]
+    return cache
+
+def _qa_period_terms(key):
+    """Return the period and amount words in a normalized question."""
+    return frozenset(match.group(0) for match in QA_PERIOD_TERMS.finditer(key))
+
+def find_cached_answer(user_id, query):
+    """
+    Look up a previous answer for the same or a semantically similar question.
+    
+    Args:
+        user_id: The user ID
+        query: The question text
+        
+    Returns:
+        Tuple of (cached answer dict or None, query embedding or None)
+    """
+    cache = _get_qa_cache(user_id)
+    key = query.strip().lower()
+    cache_key = (_qa_cache_scope(user_id), key)
+    
+    # Exact match fast path
+    if cache_key in cache:
+        cache.move_to_end(cache_key)
+        return cache[cache_key]["answer"], cache[cache_key]["embedding"]
+    
+    # Only questions about the same period can share an answer
+    terms = _qa_period_terms(key)
+    entries = [(k, e) for k, e in cache.items()
+               if e["embedding"] is not None and e["terms"] == terms]
+    if not entries:
+        # Nothing to compare against, so skip the embedding request
+        return None, None
+    
+    embedding = finance_agent.embed(key)
+    if embedding is None:
+        return None, None
+    
+    # Cosine similarity against every candidate question at once
+    query_vec = np.asarray(embedding, dtype=float)
+    matrix = np.asarray([e["embedding"] for _, e in entries], dtype=float)
+    norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query_vec)
+    similarities = matrix @ query_vec / np.where(norms > 0, norms, 1)
+    best = int(np.argmax(similarities))
+    
+    if similarities[best] > QA_SIMILARITY_THRESHOLD:
+        cache.move_to_end(entries[best][0])
+        return entries[best][1]["answer"], embedding
+    return None, embedding
+
+def store_cached_answer(user_id, query, embedding, answer_dict):
+    """Remember an answer, evicting the least recently used entry when full."""
+    cache = _get_qa_cache(user_id)
+    key = query.strip().lower()
+    cache_key = (_qa_cache_scope(user_id), key)
+    cache[cache_key] = {"embedding": embedding, "terms": _qa_period_terms(key), "answer": answer_dict}
+    cache.move_to_end(cache_key)
+    while len(cache) > QA_CACHE_SIZE:
+        cache.popitem(last=False)
+
+def _prefetch_page_data(user_id, txn_version, ai_method, txn_loader=get_txn_dicts):
+    """
+    Load transactions, goals and a page's AI text concurrently at page entry.
+    
+    Args:
+        user_id: The user ID
+        txn_version: The user's data version
+        ai_method: FinanceAgent method whose cached text the page displays
+        txn_loader: Cached loader used for the transactions
+        
+    Returns:
+        The user's transactions as dictionaries
+    """
+    goals_stale = st.session_state.get("goals_cache_key") != (user_id, txn_version)
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        txns_future = executor.submit(txn_loader, user_id, txn_version)
+        goals_future = executor.submit(db.get_goals, user_id) if goals_stale else None
+        # Warms the cache for this user_id without touching shared agent state;
+        # errors resurface where the page uses the result
+        executor.submit(_cached_ai_text, ai_method, user_id, txn_version)
+    
+    if goals_future is not None:
+        st.session_state.goals_cache = [g.to_dict() for g in goals_future.result()]
+        st.session_state.goals_cache_key = (user_id, txn_version)
+    return txns_future.result()
+
+# Cached dashboard fetches, run concurrently; each takes (user_id, txn_version) after its leading args
+DASHBOARD_FETCHES = (
+    (_load_dashboard,),
+    (_cached_agent_call, "get_financial_health_score"),
+    (_cached_agent_call, "get_budget_status"),
+    (_cached_agent_call, "get_spending_anomalies"),
+    (_cached_agent_call, "predict_transactions"),
+    (_cached_ai_text, "get_financial_summary")
+)
+
+def _fetch_dashboard_data(user_id, txn_version):
+    """
+    Run the independent dashboard fetches concurrently in worker threads.
+    
+    Args:
+        user_id: The user ID
+        txn_version: The user's data version
+        
+    Returns:
+        One result per DASHBOARD_FETCHES entry, or the exception it raised
+    """
+    with ThreadPoolExecutor(max_workers=len(DASHBOARD_FETCHES)) as executor:
+        futures = [
+            executor.submit(fetch, *args, user_id, txn_version)
+            for fetch, *args in DASHBOARD_FETCHES
+        ]
+    return [future.exception() or future.result() for future in futures]
 
 # App configuration
 st.set_page_config(
@@ -100,6 +499,7 @@ if "user_data_path" not in st.session_state:
     st.session_state.user_data_path.mkdir(exist_ok=True)
 
 # Create a function to display a page
+# Optional feature pages are imported on first visit to keep startup fast
 def show_page(page_name, user=None):
     if page_name == "Dashboard":
         show_dashboard_page(user)
@@ -110,43 +510,76 @@ def show_page(page_name, user=None):
     elif page_name == "AI Assistant":
         show_ai_assistant_page(user)
     elif page_name == "Budgets":
+        from budget import budget_management_page
         budget_management_page(user["id"])
     elif page_name == "Quantitative Finance":
+        import quantitative_finance
         quantitative_finance.run()
     elif page_name == "Finance Quiz":
+        from finance_quiz import finance_quiz_page
         finance_quiz_page(user["id"])
     elif page_name == "Credit Management":
+        from credit_management import credit_management_page
         credit_management_page(user["id"])
     elif page_name == "Financial Coaching":
+        from financial_coaching import financial_coaching_page
         financial_coaching_page(user["id"])
     elif page_name == "Crypto Finance":
+        from crypto_finance import crypto_finance_page
         crypto_finance_page(user["id"])
     elif page_name == "Financial RAG":
+        from finance_rag_ui import finance_rag_page
         finance_rag_page()
     elif page_name == "Settings":
         show_settings_page(user)
     else:
         st.error("Page not found")
 
+@st.fragment
+def _tabbed_charts_fragment(user_id, txn_version):
+    """Render the time-period selector and tabbed charts, rerunning only this section."""
+    # Add time period selector
+    time_period = st.selectbox(
+        "Time Period",
+        ["Last 30 Days", "Last 7 Days", "Last 90 Days", "This Year", "All Time"],
+        index=0
+    )
+    
+    # Convert selection to parameter
+    if time_period == "Last 7 Days":
+        period_param = "week"
+    elif time_period == "Last 30 Days":
+        period_param = "month"
+    elif time_period == "Last 90 Days":
+        period_param = "quarter"
+    elif time_period == "This Year":
+        period_param = "year"
+    else:  # All Time
+        period_param = "all"
+        
+    # Show tabbed charts
+    create_tabbed_charts(user_id, period_param, txn_version)
+
 # Dashboard page
 def show_dashboard_page(user):
     st.title("Financial Dashboard")
     
-    # Set user in the finance agent
     user_id = user["id"]
-    finance_agent.set_user(user_id)
-    
-    # Get user's transactions
-    transactions = db.get_transactions(user_id)
-    txn_dicts = [t.to_dict() for t in transactions]
-    
-    # Current balance and summary metrics
-    balance = db.calculate_balance(user_id)
-    summary = db.get_transaction_summary(user_id)
-    financial_health = finance_agent.get_financial_health_score()
-    
+    txn_version = get_txn_version(user_id)
+
+    # Fetch transactions, metrics and agent analyses concurrently (cached per data version)
+    results = _fetch_dashboard_data(user_id, txn_version)
+    for result in results[:-1]:
+        if isinstance(result, Exception):
+            raise result
+    (dashboard_data, financial_health, budget_status,
+     anomalies, predictions, financial_summary) = results
+
+    txn_dicts = dashboard_data["txns"]
+    balance = dashboard_data["balance"]
+    summary = dashboard_data["summary"]
+
     # Check for budget status
-    budget_status = finance_agent.get_budget_status()
     budget_warnings = [b for b in budget_status if b.get("warning_level") in ["warning", "critical"]]
     
     # Display budget warnings at the top if any exist
@@ -169,10 +602,6 @@ def show_dashboard_page(user):
     # Top metrics row
     st.subheader("Financial Overview")
     
-    # Get advanced financial data
-    anomalies = finance_agent.get_spending_anomalies()
-    predictions = finance_agent.predict_transactions()
-    
     # Define metrics data
     primary_metrics = [
         {"label": "Current Balance", "value": format_currency(balance), "delta": None},
@@ -181,38 +610,6 @@ def show_dashboard_page(user):
         {"label": "Savings Rate", "value": f"{summary.get('savings_rate', 0) * 100:.1f}%", "delta": None}
     ]
     
-    # Render primary metrics in a grid with retro styling
-    col1, col2, col3, col4 = st.columns(4)
-    
-    # Display metrics in retro style
-    with col1:
-        retro_metric(
-            primary_metrics[0]["label"],
-            primary_metrics[0]["value"],
-            primary_metrics[0]["delta"]
-        )
-    with col2:
-        retro_metric(
-            primary_metrics[1]["label"],
-            primary_metrics[1]["value"],
-            primary_metrics[1]["delta"]
-        )
-    with col3:
-        retro_metric(
-            primary_metrics[2]["label"],
-            primary_metrics[2]["value"],
-            primary_metrics[2]["delta"]
-        )
-    with col4:
-        retro_metric(
-            primary_metrics[3]["label"],
-            primary_metrics[3]["value"],
-            primary_metrics[3]["delta"]
-        )
-    
-    # Add some space
-    st.markdown("<div style='height: 20px'></div>", unsafe_allow_html=True)
-    
     # Advanced metrics with more context
     advanced_metrics = [
         {
@@ -238,38 +635,11 @@ def show_dashboard_page(user):
         }
     ]
     
-    # Render advanced metrics in a grid with retro styling
-    col1, col2, col3, col4 = st.columns(4)
-    
-    # Display metrics in retro style
-    with col1:
-        retro_metric(
-            advanced_metrics[0]["label"],
-            advanced_metrics[0]["value"],
-            advanced_metrics[0]["delta"],
-            delta_color=advanced_metrics[0].get("delta_color", "normal")
-        )
-    with col2:
-        retro_metric(
-            advanced_metrics[1]["label"],
-            advanced_metrics[1]["value"],
-            advanced_metrics[1]["delta"]
-        )
-    with col3:
-        retro_metric(
-            advanced_metrics[2]["label"],
-            advanced_metrics[2]["value"],
-            advanced_metrics[2]["delta"]
-        )
-    with col4:
-        retro_metric(
-            advanced_metrics[3]["label"],
-            advanced_metrics[3]["value"],
-            advanced_metrics[3]["delta"]
-        )
+    # Render both metric rows as a single grid element
+    st.markdown(retro_metric_grid(primary_metrics + advanced_metrics), unsafe_allow_html=True)
     
     # AI-powered greeting card with enhanced styling
-    ai_greeting = finance_agent.generate_assistant_message()
+    ai_greeting = _cached_ai_text("generate_assistant_message", user_id, get_txn_version(user_id))
     
     # Use our custom card renderer
     render_card(
@@ -287,20 +657,20 @@ def show_dashboard_page(user):
     with col1:
         # Spending by category
         get_date_range("month")  # Not used now
-        category_data = db.get_category_spending(user_id)
-        fig = create_spending_by_category_chart(category_data)
+        category_data = dashboard_data["category"]
+        fig = _cached_category_chart(tuple(category_data.items()))
         st.plotly_chart(fig, use_container_width=True)
         
         # Show anomalies if any exist with custom styling
         if anomalies:
             st.subheader("⚠️ Unusual Spending Detected")
-            # Limit to top 3 anomalies
+            # Build the top 3 anomalies into a single card
+            anomaly_blocks = []
             for anomaly in anomalies[:3]:
                 txn = anomaly.get("transaction", {})
                 pct_above = anomaly.get("percent_above_average", 0)
                 
-                # Use custom card with badge
-                content = f"""
+                anomaly_blocks.append(f"""
                 <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 8px;">
                     <span style="font-weight: bold; font-size: 1.1rem;">{txn.get('description', 'Unknown')}</span>
                     <span style="font-weight: bold; color: #e74c3c;">{format_currency(txn.get('amount', 0))}</span>
@@ -312,17 +682,18 @@ def show_dashboard_page(user):
                 <div style="font-size: 0.9rem; opacity: 0.8; margin-top: 8px;">
                     This amount is significantly higher than your usual spending in this category.
                 </div>
-                """
-                
-                render_card(
-                    title=None,
-                    content=content,
-                    icon="warning"
-                )
+                """)
+            
+            render_card(
+                title=None,
+                content="<hr style='opacity: 0.2;'>".join(anomaly_blocks)
+            )
     
     with col2:
         # Balance trend
-        balance_fig = create_balance_chart(txn_dicts)
+        balance_fig = _cached_balance_chart(
+            tuple((t["date"], t["amount"], t["type"]) for t in txn_dicts)
+        )
         st.plotly_chart(balance_fig, use_container_width=True)
         
         # Predicted expenses
@@ -348,35 +719,16 @@ def show_dashboard_page(user):
     
     # Tabbed Financial Charts
     st.subheader("Financial Charts")
-    # Add time period selector
-    time_period = st.selectbox(
-        "Time Period",
-        ["Last 30 Days", "Last 7 Days", "Last 90 Days", "This Year", "All Time"],
-        index=0
-    )
-    
-    # Convert selection to parameter
-    if time_period == "Last 7 Days":
-        period_param = "week"
-    elif time_period == "Last 30 Days":
-        period_param = "month"
-    elif time_period == "Last 90 Days":
-        period_param = "quarter"
-    elif time_period == "This Year":
-        period_param = "year"
-    else:  # All Time
-        period_param = "all"
-        
-    # Show tabbed charts
-    create_tabbed_charts(user_id, period_param)
+    _tabbed_charts_fragment(user_id, txn_version)
     
     # Financial summary from AI
     st.subheader("AI Financial Analysis")
     if txn_dicts:
         with st.spinner("Generating financial analysis..."):
             try:
-                financial_summary = finance_agent.get_financial_summary()
-                
+                if isinstance(financial_summary, Exception):
+                    raise financial_summary
+
                 # Display summary text with enhanced card
                 render_card(
                     title="💡 Financial Insights", 
@@ -391,7 +743,7 @@ def show_dashboard_page(user):
                 top_categories = financial_summary.get('top_expense_categories', [])
                 if top_categories:
                     st.subheader("Top Expense Categories")
-                    top_cat_df = pd.DataFrame(top_categories)
+                    top_cat_df = pd.DataFrame(list(top_categories))
                     
                     fig = px.pie(
                         top_cat_df,
@@ -413,10 +765,11 @@ def show_dashboard_page(user):
     
     if recommendations:
         # Create a card with all recommendations
-        rec_content = ""
-        for i, rec in enumerate(recommendations):
-            rec_type = "success" if i % 3 == 0 else ("warning" if i % 3 == 1 else "info")
-            rec_content += f'<div style="margin-bottom: 12px;">{badge("Tip", rec_type)} {rec}</div>'
+        rec_types = ("success", "warning", "info")
+        rec_content = "".join(
+            f'<div style="margin-bottom: 12px;">{badge("Tip", rec_types[i % 3])} {rec}</div>'
+            for i, rec in enumerate(recommendations)
+        )
         
         # Display in a card
         render_card(
@@ -430,13 +783,17 @@ def show_dashboard_page(user):
 def show_transactions_page(user):
     st.title("Transaction Management")
     
-    # Set user in finance agent
+    # Bind the shared finance agent to this user
     user_id = user["id"]
-    finance_agent.set_user(user_id)
+    agent = finance_agent.for_user(user_id)
     
-    # Get user's transactions from database
-    transactions = db.get_transactions(user_id)
-    txn_dicts = [t.to_dict() for t in transactions]
+    # Get user's transactions (cached per data version)
+    txn_dicts = get_txn_dicts(user_id, get_txn_version(user_id))
+
+    # Tabular view of the transactions, with dates parsed once for filtering and sorting
+    txn_df = pd.DataFrame(txn_dicts)
+    if not txn_df.empty:
+        txn_df['date'] = pd.to_datetime(txn_df['date'], format="%Y-%m-%d", cache=True)
     
     # Add transaction section
     st.subheader("Add New Transaction")
@@ -469,9 +826,9 @@ def show_transactions_page(user):
         if submit:
             if description and amount > 0:
                 try:
-                    # Determine category with AI if needed
-                    if use_ai_category and description:
-                        category = finance_agent.categorize_transaction(description)
+                    # AI categorization runs in the background after the insert
+                    if use_ai_category:
+                        category = "Uncategorized"
                     
                     # Create transaction data
                     transaction_data = {
@@ -487,14 +844,19 @@ def show_transactions_page(user):
                     new_transaction = db.create_transaction(user_id, transaction_data)
                     
                     if new_transaction:
-                        # Process with vector engine
-                        vp.process_new_transaction(new_transaction.to_dict())
-                        
-                        # Get insights about the transaction
-                        asyncio.run(finance_agent.analyze_transaction(new_transaction.id))
+                        if use_ai_category:
+                            # Categorize, index, and analyze off the request path
+                            enrich_transaction_in_background(user_id, new_transaction.id, description)
+                        else:
+                            # Process with vector engine
+                            vp.process_new_transaction(new_transaction.to_dict())
+                            
+                            # Analyze the transaction in the background
+                            analyze_transaction_in_background(user_id, new_transaction.id)
                         
                         st.success("Transaction added successfully!")
                         # Refresh transactions
+                        invalidate_user_data(user_id)
                         st.rerun()
                     else:
                         st.error("Failed to add transaction. Please try again.")
@@ -517,8 +879,7 @@ def show_transactions_page(user):
                                       ["All", "Income", "Expense"])
         with col2:
             if txn_dicts:
-                categories = ["All"] + list(set([t.get("category", "Other") 
-                              for t in txn_dicts]))
+                categories = ["All"] + sorted(pd.unique(txn_df['category'].fillna("Other")).tolist())
                 filter_category = st.selectbox("Filter by Category", categories)
             else:
                 filter_category = "All"
@@ -526,72 +887,55 @@ def show_transactions_page(user):
         with col3:
             search_term = st.text_input("Search", key="table_search")
         
-        # Apply filters
-        filtered_transactions = txn_dicts.copy()
-        
-        if filter_type != "All":
-            filtered_transactions = [t for t in filtered_transactions 
-                                    if t.get("type", "").lower() == filter_type.lower()]
-        
-        if filter_category != "All":
-            filtered_transactions = [t for t in filtered_transactions 
-                                    if t.get("category", "Other") == filter_category]
-        
-        if search_term:
-            filtered_transactions = [t for t in filtered_transactions 
-                                    if search_term.lower() in t.get("description", "").lower()]
-        
-        # Sort by date (newest first)
-        filtered_transactions.sort(key=lambda x: x.get("date", ""), reverse=True)
-        
-        # Display transactions
-        if filtered_transactions:
-            # Convert to dataframe
-            df = pd.DataFrame(filtered_transactions)
+        # Apply filters with vectorized masks
+        if txn_dicts:
+            mask = pd.Series(True, index=txn_df.index)
             
-            # Format dataframe
-            df['date'] = pd.to_datetime(df['date'])
-            df['date'] = df['date'].dt.strftime('%b %d, %Y')
-            df['amount_display'] = df.apply(
-                lambda x: format_currency(x['amount']), axis=1
-            )
+            if filter_type != "All":
+                mask &= txn_df['type'].fillna("").str.lower() == filter_type.lower()
             
-            # Conditional styling
-            def color_type(val):
-                if val == 'income':
-                    return 'color: green'
-                else:
-                    return 'color: red'
+            if filter_category != "All":
+                mask &= txn_df['category'].fillna("Other") == filter_category
+            
+            if search_term:
+                mask &= txn_df['description'].fillna("").str.contains(search_term, case=False, regex=False)
+            
+            # Sort by date (newest first)
+            df = txn_df[mask].sort_values('date', ascending=False)
+        else:
+            df = txn_df
+        
+        # Display transactions
+        if not df.empty:
+            # Conditional styling, computed for the whole column at once
+            def color_type(col):
+                return np.where(col == 'income', 'color: green', 'color: red')
             
             # Select columns for display
-            styled_df = df[['date', 'description', 'category', 'type', 'amount_display']]
+            styled_df = df[['date', 'description', 'category', 'type', 'amount']]
             styled_df = styled_df.rename(columns={
                 'date': 'Date',
                 'description': 'Description',
                 'category': 'Category',
                 'type': 'Type',
-                'amount_display': 'Amount'
+                'amount': 'Amount'
             })
             
-            # Display the table
+            # Display the table, formatting dates and amounts client-side
             st.dataframe(
-                styled_df.style.applymap(color_type, subset=['Type']),
+                styled_df.style.apply(color_type, subset=['Type']),
+                column_config=TRANSACTION_COLUMN_CONFIG,
                 use_container_width=True,
                 height=400
             )
             
             # Export transactions
-            if st.button("Export Transactions"):
-                # Convert to CSV
-                csv = df.to_csv(index=False)
-                
-                # Offer download
-                st.download_button(
-                    label="Download CSV",
-                    data=csv,
-                    file_name="transactions_export.csv",
-                    mime="text/csv"
-                )
+            st.download_button(
+                label="Export Transactions",
+                data=_transactions_csv(user_id, get_txn_version(user_id), (filter_type, filter_category, search_term), df),
+                file_name="transactions_export.csv",
+                mime="text/csv"
+            )
         else:
             st.info("No transactions found with the selected filters.")
     
@@ -614,7 +958,8 @@ def show_transactions_page(user):
             else:  # All time
                 start_date = None
                 
-            end_date = today.strftime("%Y-%m-%d")
+            # "All time" is open-ended, so future-dated transactions stay included
+            end_date = today.strftime("%Y-%m-%d") if start_date else None
             
             # Filter transactions by date
             if start_date:
@@ -634,8 +979,9 @@ def show_transactions_page(user):
                 
                 with analytics_tabs[1]:  # Income vs Expense
                     # Calculate income and expense totals
-                    income_total = sum(t["amount"] for t in filtered_txns if t["type"] == "income")
-                    expense_total = sum(t["amount"] for t in filtered_txns if t["type"] == "expense")
+                    totals = db.get_income_expense_totals(user_id, start_date, end_date)
+                    income_total = totals["income"]
+                    expense_total = totals["expense"]
                     
                     # Create bar chart
                     comparison_df = pd.DataFrame({
@@ -692,7 +1038,7 @@ def show_transactions_page(user):
             with st.spinner("Searching..."):
                 try:
                     # Use vector search through finance agent
-                    search_results = finance_agent.search_transactions(search_query)
+                    search_results = agent.search_transactions(search_query)
                     
                     if search_results:
                         st.success(f"Found {len(search_results)} matching transactions")
@@ -701,22 +1047,22 @@ def show_transactions_page(user):
                         result_df = pd.DataFrame(search_results)
                         
                         # Format for display
-                        result_df['date'] = pd.to_datetime(result_df['date']) 
-                        result_df['date'] = result_df['date'].dt.strftime('%b %d, %Y')
-                        result_df['amount_display'] = result_df.apply(
-                            lambda x: format_currency(x['amount']), axis=1
-                        )
+                        result_df['date'] = pd.to_datetime(result_df['date'], format="%Y-%m-%d", cache=True)
                         
-                        display_cols = ['date', 'description', 'category', 'type', 'amount_display']
+                        display_cols = ['date', 'description', 'category', 'type', 'amount']
                         display_df = result_df[display_cols].rename(columns={
                             'date': 'Date',
                             'description': 'Description',
                             'category': 'Category',
                             'type': 'Type',
-                            'amount_display': 'Amount'
+                            'amount': 'Amount'
                         })
                         
-                        st.dataframe(display_df, use_container_width=True)
+                        st.dataframe(
+                            display_df,
+                            column_config=TRANSACTION_COLUMN_CONFIG,
+                            use_container_width=True
+                        )
                     else:
                         st.info("No matching transactions found. Try a different search query.")
                 except Exception as e:
@@ -724,21 +1070,200 @@ def show_transactions_page(user):
         elif search_button:
             st.warning("Please enter a search query.")
 
+def _forecast_goal_completion(targets, currents, deadlines, monthly_savings, now):
+    """
+    Forecast when each goal completes at the current savings rate.
+    
+    Args:
+        targets: Goal target amounts
+        currents: Goal current amounts
+        deadlines: Goal deadlines as datetime64[s]
+        monthly_savings: Estimated savings per month
+        now: Current time as datetime64[s]
+        
+    Returns:
+        Tuple of (completed mask, forecast dates with NaT when unreachable, on-track mask)
+    """
+    remaining = np.maximum(targets - currents, 0.0)
+    completed = remaining <= 0
+    
+    # Calculate months needed (unreachable goals get no forecast date)
+    months_needed = np.where(monthly_savings > 0, remaining / max(monthly_savings, 1e-12), np.inf)
+    reachable = np.isfinite(months_needed)
+    days_needed = np.where(reachable, months_needed * 30, 0).astype(np.int64)
+    forecast_dates = np.where(
+        reachable,
+        now + days_needed.astype("timedelta64[D]"),
+        np.datetime64("NaT", "s")
+    )
+    
+    on_track = completed | (forecast_dates <= deadlines)
+    return completed, forecast_dates, on_track
+
+# Savings plan text templates
+SAVINGS_PLAN_ON_TRACK = (
+    "### Your Savings Plan\n\n"
+    "Based on your financial history, you could save approximately "
+    "{savings} per month. At this rate, you can reach your "
+    "goal of {goal} in about {months:.1f} months, "
+    "which is within your desired timeframe of {timeframe} months.\n\n"
+    "**Recommended actions:**\n"
+    "- Set up an automatic transfer of {savings} to a savings account each month\n"
+    "- Track your progress regularly\n"
+    "- Consider cutting expenses in the following categories: "
+    "{categories}"
+)
+
+SAVINGS_PLAN_SHORTFALL = (
+    "### Your Savings Plan\n\n"
+    "Based on your financial history, you currently save about "
+    "{savings} per month. To reach your "
+    "goal of {goal} within {timeframe} months, "
+    "you'll need to save {required} per month. "
+    "This means you need to find an additional {reduction} "
+    "in savings each month.\n\n"
+    "**Recommended actions:**\n"
+    "- Reduce spending in: "
+    "{categories}\n"
+    "- Set up an automatic transfer of {required} to a savings account\n"
+    "- Look for additional income opportunities"
+)
+
+@st.fragment
+def _goals_list_fragment(user_id, goal_dicts, txn_version):
+    """Render the goal list and charts, rerunning only this section on goal edits."""
+    if goal_dicts:
+        goals_tab, chart_tab = st.tabs(["Goals List", "Visualization"])
+        
+        with goals_tab:
+            # Goal progress edits are queued and saved together
+            pending_updates = st.session_state.setdefault("pending_goal_updates", {})
+            if pending_updates:
+                st.info(f"{len(pending_updates)} goal update(s) queued.")
+                if st.button("Save All Goal Updates", key="save_goal_updates"):
+                    try:
+                        db.update_goals_bulk(pending_updates)
+                        
+                        # Patch the session goals and rerun only this section
+                        for goal in goal_dicts:
+                            goal.update(pending_updates.get(goal['id'], {}))
+                        st.session_state.pending_goal_updates = {}
+                        invalidate_goal_data(user_id)
+                        st.rerun(scope="fragment")
+                    except Exception as e:
+                        st.error(f"Error updating goals: {str(e)}")
+            
+            for i, goal in enumerate(goal_dicts):
+                col1, col2 = st.columns([3, 1])
+                
+                with col1:
+                    st.markdown(f"### {goal['name']}")
+                    st.markdown(f"Target: **{format_currency(goal['target_amount'])}** by "
+                               f"{goal['deadline']} ({goal['category']})")
+                    
+                    # Progress bar
+                    progress = min(1.0, goal['current_amount'] / goal['target_amount'])
+                    st.progress(progress)
+                    
+                    # Progress text
+                    st.markdown(f"**{format_currency(goal['current_amount'])}** of "
+                               f"**{format_currency(goal['target_amount'])}** "
+                               f"({progress*100:.1f}%)")
+                
+                with col2:
+                    # Update progress
+                    form_key = f"update_goal_{goal['id']}"
+                    with st.form(key=form_key):
+                        current_amount = st.number_input(
+                            "Current Amount", 
+                            min_value=0.0, 
+                            max_value=float(goal['target_amount']),
+                            value=float(goal['current_amount']),
+                            key=f"goal_amt_{goal['id']}"
+                        )
+                        if st.form_submit_button("Update"):
+                            # Queue the update for the next bulk save
+                            pending_updates[goal['id']] = {
+                                "current_amount": current_amount
+                            }
+                            st.rerun(scope="fragment")
+                    if goal['id'] in pending_updates:
+                        st.caption("Queued")
+                
+                st.divider()
+        
+        with chart_tab:
+            # Parse goal deadlines once for the timeline and forecast tabs
+            goal_deadlines = pd.to_datetime([g["deadline"] for g in goal_dicts], format="%Y-%m-%d")
+            
+            # Create visualization tabs
+            viz_tabs = st.tabs(["Progress Chart", "Timeline", "Completion Forecast"])
+            
+            with viz_tabs[0]:  # Progress Chart
+                fig = _build_progress_fig(tuple(
+                    (g["name"], g["target_amount"], g["current_amount"]) for g in goal_dicts
+                ))
+                
+                st.plotly_chart(fig, use_container_width=True)
+            
+            with viz_tabs[1]:  # Timeline
+                fig = _build_timeline_fig(
+                    tuple(
+                        (g["name"], deadline, g["target_amount"], g["current_amount"])
+                        for g, deadline in zip(goal_dicts, goal_deadlines)
+                    ),
+                    datetime.date.today()
+                )
+                
+                st.plotly_chart(fig, use_container_width=True)
+            
+            with viz_tabs[2]:  # Completion Forecast
+                # Calculate estimated completion dates
+                try:
+                    financial_summary = _cached_ai_text("get_financial_summary", user_id, txn_version)
+                    total_monthly_savings = financial_summary.get("total_income", 0) - financial_summary.get("total_expenses", 0)
+                    monthly_savings = max(0.0, total_monthly_savings / 3)  # Assume 3 months of data
+                    
+                    forecast_df = pd.DataFrame(goal_dicts)
+                    completed, forecast_dates, on_track = _forecast_goal_completion(
+                        forecast_df["target_amount"].to_numpy(dtype=float),
+                        forecast_df["current_amount"].to_numpy(dtype=float),
+                        goal_deadlines.to_numpy(dtype="datetime64[s]"),
+                        monthly_savings,
+                        np.datetime64(datetime.datetime.now(), "s")
+                    )
+                    
+                    forecast_df["status"] = np.where(completed, "Completed", "In Progress")
+                    forecast_df["target_date"] = forecast_df["deadline"]
+                    forecast_df["forecast_date"] = pd.Series(forecast_dates).dt.strftime("%Y-%m-%d").fillna("an unknown date")
+                    forecast_df.loc[completed, "forecast_date"] = "Completed"
+                    forecast_df["on_track"] = on_track
+                    forecast_data = forecast_df[["name", "status", "target_date", "forecast_date", "on_track"]].to_dict("records")
+                    
+                    # Display the forecast
+                    for i, row in enumerate(forecast_data):
+                        if row["status"] == "Completed":
+                            st.success(f"**{row['name']}**: Goal completed ✓")
+                        elif row["on_track"]:
+                            st.info(f"**{row['name']}**: On track to complete by {row['forecast_date']} (before deadline of {row['target_date']})")
+                        else:
+                            st.warning(f"**{row['name']}**: Projected completion on {row['forecast_date']} - **after** deadline of {row['target_date']}")
+                except Exception as e:
+                    st.warning(f"Could not generate forecast: {str(e)}")
+                    st.info("Add more transaction data for better forecasting.")
+    else:
+        st.info("No goals set yet. Create a goal to get started!")
+
 # Goals page
 def show_goals_page(user):
     st.title("Financial Goals")
     
-    # Set user in finance agent
     user_id = user["id"]
-    finance_agent.set_user(user_id)
-    
-    # Get user's data from database
-    goals = db.get_goals(user_id)
-    transactions = db.get_transactions(user_id)
     
-    # Convert to dictionaries for processing
-    goal_dicts = [g.to_dict() for g in goals]
-    txn_dicts = [t.to_dict() for t in transactions]
+    # Get user's data concurrently (goals are kept in the session and patched in place on edits)
+    txn_version = get_txn_version(user_id)
+    txn_dicts = _prefetch_page_data(user_id, txn_version, "get_financial_summary")
+    goal_dicts = get_goal_dicts(user_id)
     
     # Goal overview
     if goal_dicts:
@@ -774,7 +1299,7 @@ def show_goals_page(user):
                 with st.spinner("Generating your personalized savings plan..."):
                     try:
                         # Use AI to analyze transactions and generate a plan
-                        financial_summary = finance_agent.get_financial_summary()
+                        financial_summary = _cached_ai_text("get_financial_summary", user_id, txn_version)
                         
                         # Calculate monthly income and expenses
                         monthly_income = financial_summary.get("total_income", 0) / 3  # Assume 3 months of data
@@ -786,38 +1311,33 @@ def show_goals_page(user):
                         # Calculate months needed
                         months_needed = goal_amount / potential_savings if potential_savings > 0 else float('inf')
                         
+                        # Precompute values shared by both plan variants
+                        potential_savings_str, goal_amount_str = map(format_currency, (potential_savings, goal_amount))
+                        top_expense_categories = financial_summary.get('top_expense_categories', ())
+                        top_categories = [cat['category'] for cat in top_expense_categories[:3]]
+                        
                         # Generate plan text
                         if months_needed <= timeframe:
-                            plan = (
-                                f"### Your Savings Plan\n\n"
-                                f"Based on your financial history, you could save approximately "
-                                f"{format_currency(potential_savings)} per month. At this rate, you can reach your "
-                                f"goal of {format_currency(goal_amount)} in about {months_needed:.1f} months, "
-                                f"which is within your desired timeframe of {timeframe} months.\n\n"
-                                f"**Recommended actions:**\n"
-                                f"- Set up an automatic transfer of {format_currency(potential_savings)} to a savings account each month\n"
-                                f"- Track your progress regularly\n"
-                                f"- Consider cutting expenses in the following categories: "
-                                f"{', '.join([cat['category'] for cat in financial_summary.get('top_expense_categories', [])[:2]])}"
+                            plan = SAVINGS_PLAN_ON_TRACK.format(
+                                savings=potential_savings_str,
+                                goal=goal_amount_str,
+                                months=months_needed,
+                                timeframe=timeframe,
+                                categories=', '.join(top_categories[:2])
                             )
                         else:
                             # Calculate required savings
                             required_savings = goal_amount / timeframe
                             expense_reduction = required_savings - potential_savings
+                            required_savings_str, expense_reduction_str = map(format_currency, (required_savings, expense_reduction))
                             
-                            plan = (
-                                f"### Your Savings Plan\n\n"
-                                f"Based on your financial history, you currently save about "
-                                f"{format_currency(potential_savings)} per month. To reach your "
-                                f"goal of {format_currency(goal_amount)} within {timeframe} months, "
-                                f"you'll need to save {format_currency(required_savings)} per month. "
-                                f"This means you need to find an additional {format_currency(expense_reduction)} "
-                                f"in savings each month.\n\n"
-                                f"**Recommended actions:**\n"
-                                f"- Reduce spending in: "
-                                f"{', '.join([cat['category'] for cat in financial_summary.get('top_expense_categories', [])[:3]])}\n"
-                                f"- Set up an automatic transfer of {format_currency(required_savings)} to a savings account\n"
-                                f"- Look for additional income opportunities"
+                            plan = SAVINGS_PLAN_SHORTFALL.format(
+                                savings=potential_savings_str,
+                                goal=goal_amount_str,
+                                timeframe=timeframe,
+                                required=required_savings_str,
+                                reduction=expense_reduction_str,
+                                categories=', '.join(top_categories)
                             )
                         
                         st.success("Plan generated!")
@@ -866,9 +1386,10 @@ def show_goals_page(user):
                     new_goal = db.create_goal(user_id, goal_data)
                     
                     if new_goal:
+                        # Add to the session goals; the list below renders it without a full rerun
+                        goal_dicts.append(new_goal.to_dict())
+                        invalidate_goal_data(user_id)
                         st.success("Goal added successfully!")
-                        # Refresh goals
-                        st.rerun()
                     else:
                         st.error("Failed to add goal. Please try again.")
                 except Exception as e:
@@ -879,212 +1400,23 @@ def show_goals_page(user):
     # Goal list and progress
     st.subheader("Your Financial Goals")
     
-    if goal_dicts:
-        goals_tab, chart_tab = st.tabs(["Goals List", "Visualization"])
-        
-        with goals_tab:
-            for i, goal in enumerate(goal_dicts):
-                col1, col2 = st.columns([3, 1])
-                
-                with col1:
-                    st.markdown(f"### {goal['name']}")
-                    st.markdown(f"Target: **{format_currency(goal['target_amount'])}** by "
-                               f"{goal['deadline']} ({goal['category']})")
-                    
-                    # Progress bar
-                    progress = min(1.0, goal['current_amount'] / goal['target_amount'])
-                    st.progress(progress)
-                    
-                    # Progress text
-                    st.markdown(f"**{format_currency(goal['current_amount'])}** of "
-                               f"**{format_currency(goal['target_amount'])}** "
-                               f"({progress*100:.1f}%)")
-                
-                with col2:
-                    # Update progress
-                    form_key = f"update_goal_{goal['id']}"
-                    with st.form(key=form_key):
-                        current_amount = st.number_input(
-                            "Current Amount", 
-                            min_value=0.0, 
-                            max_value=float(goal['target_amount']),
-                            value=float(goal['current_amount']),
-                            key=f"goal_amt_{goal['id']}"
-                        )
-                        if st.form_submit_button("Update"):
-                            try:
-                                # Create updated goal data
-                                updated_data = {
-                                    "current_amount": current_amount
-                                }
-                                
-                                # Update in database
-                                updated_goal = db.update_goal(goal['id'], updated_data)
-                                
-                                if updated_goal:
-                                    st.success("Goal progress updated!")
-                                    # Refresh goals
-                                    st.rerun()
-                                else:
-                                    st.error("Failed to update goal. Please try again.")
-                            except Exception as e:
-                                st.error(f"Error updating goal: {str(e)}")
-                
-                st.divider()
-        
-        with chart_tab:
-            # Create visualization tabs
-            viz_tabs = st.tabs(["Progress Chart", "Timeline", "Completion Forecast"])
-            
-            with viz_tabs[0]:  # Progress Chart
-                # Convert goals for chart
-                goal_data = []
-                for g in goal_dicts:
-                    goal_data.append({
-                        "name": g["name"],
-                        "target": g["target_amount"],
-                        "current": g["current_amount"],
-                        "percent": (g["current_amount"] / g["target_amount"]) * 100 if g["target_amount"] > 0 else 0
-                    })
-                
-                # Create a DataFrame
-                goal_df = pd.DataFrame(goal_data)
-                
-                # Create a horizontal bar chart
-                fig = px.bar(
-                    goal_df,
-                    y="name",
-                    x="percent",
-                    orientation='h',
-                    labels={"name": "Goal", "percent": "Progress (%)"},
-                    text="percent",
-                    color="percent",
-                    color_continuous_scale="Blues",
-                    range_x=[0, 100]
-                )
-                
-                # Add text labels
-                fig.update_traces(texttemplate='%{text:.1f}%', textposition='outside')
-                
-                # Add a vertical line at 100%
-                fig.add_vline(x=100, line_dash="dash", line_color="green", annotation_text="Target")
-                
-                # Layout
-                fig.update_layout(
-                    title="Goal Progress",
-                    yaxis=dict(autorange="reversed"),  # Reverse the order of goals
-                    margin=dict(l=20, r=20, t=40, b=20),
-                    height=400
-                )
-                
-                st.plotly_chart(fig, use_container_width=True)
-            
-            with viz_tabs[1]:  # Timeline
-                # Create a DataFrame with goal deadlines
-                timeline_data = []
-                for g in goal_dicts:
-                    deadline = datetime.datetime.strptime(g["deadline"], "%Y-%m-%d")
-                    days_left = (deadline - datetime.datetime.now()).days
-                    status = "Completed" if g["current_amount"] >= g["target_amount"] else "In Progress"
-                    
-                    timeline_data.append({
-                        "name": g["name"],
-                        "deadline": deadline,
-                        "days_left": max(0, days_left),
-                        "status": status
-                    })
-                
-                # Create a DataFrame
-                timeline_df = pd.DataFrame(timeline_data)
-                timeline_df["deadline_str"] = timeline_df["deadline"].dt.strftime("%b %d, %Y")
-                timeline_df = timeline_df.sort_values("deadline")
-                
-                # Create a horizontal bar chart
-                fig = px.bar(
-                    timeline_df,
-                    y="name",
-                    x="days_left",
-                    orientation='h',
-                    labels={"name": "Goal", "days_left": "Days Left"},
-                    text="deadline_str",
-                    color="status",
-                    color_discrete_map={"Completed": "#4CAF50", "In Progress": "#2196F3"}
-                )
-                
-                # Add text labels
-                fig.update_traces(textposition='outside')
-                
-                # Layout
-                fig.update_layout(
-                    title="Goal Timeline",
-                    yaxis=dict(autorange="reversed"),  # Reverse the order of goals
-                    margin=dict(l=20, r=20, t=40, b=20),
-                    height=400
-                )
-                
-                st.plotly_chart(fig, use_container_width=True)
-            
-            with viz_tabs[2]:  # Completion Forecast
-                # Calculate estimated completion dates
-                forecast_data = []
-                try:
-                    financial_summary = finance_agent.get_financial_summary()
-                    total_monthly_savings = financial_summary.get("total_income", 0) - financial_summary.get("total_expenses", 0)
-                    monthly_savings = max(0, total_monthly_savings / 3)  # Assume 3 months of data
-                    
-                    for g in goal_dicts:
-                        remaining = g["target_amount"] - g["current_amount"]
-                        if remaining <= 0:
-                            # Already completed
-                            forecast_data.append({
-                                "name": g["name"],
-                                "status": "Completed",
-                                "target_date": g["deadline"],
-                                "forecast_date": "Completed",
-                                "on_track": True
-                            })
-                        else:
-                            # Calculate months needed
-                            months_needed = remaining / monthly_savings if monthly_savings > 0 else float('inf')
-                            forecast_date = datetime.datetime.now() + datetime.timedelta(days=int(months_needed * 30))
-                            deadline = datetime.datetime.strptime(g["deadline"], "%Y-%m-%d")
-                            
-                            forecast_data.append({
-                                "name": g["name"],
-                                "status": "In Progress",
-                                "target_date": g["deadline"],
-                                "forecast_date": forecast_date.strftime("%Y-%m-%d"),
-                                "on_track": forecast_date <= deadline
-                            })
-                    
-                    # Display the forecast
-                    for i, row in enumerate(forecast_data):
-                        if row["status"] == "Completed":
-                            st.success(f"**{row['name']}**: Goal completed ✓")
-                        elif row["on_track"]:
-                            st.info(f"**{row['name']}**: On track to complete by {row['forecast_date']} (before deadline of {row['target_date']})")
-                        else:
-                            st.warning(f"**{row['name']}**: Projected completion on {row['forecast_date']} - **after** deadline of {row['target_date']}")
-                except Exception as e:
-                    st.warning(f"Could not generate forecast: {str(e)}")
-                    st.info("Add more transaction data for better forecasting.")
-    else:
-        st.info("No goals set yet. Create a goal to get started!")
+    _goals_list_fragment(user_id, goal_dicts, txn_version)
 
 # AI Assistant page
 def show_ai_assistant_page(user):
     st.title("AI Financial Assistant")
     
-    # Set user in the finance agent
+    # Bind the shared finance agent to this user
     user_id = user["id"]
-    finance_agent.set_user(user_id)
+    agent = finance_agent.for_user(user_id)
     
-    # Get transactions
-    transactions = db.get_transactions(user_id)
-    txn_dicts = [t.to_dict() for t in transactions]
+    # Get transactions and the greeting concurrently (cached per data version)
+    txn_version = get_txn_version(user_id)
+    txn_dicts = _prefetch_page_data(user_id, txn_version, "generate_assistant_message", get_light_txn_dicts)
+    txn_by_id = {t["id"]: t for t in txn_dicts}
     
     # Display AI assistant greeting
-    ai_greeting = finance_agent.generate_assistant_message()
+    ai_greeting = _cached_ai_text("generate_assistant_message", user_id, txn_version)
     st.markdown(f"""
     <div class="insight-card">
         <h3>Welcome to Your AI Financial Assistant</h3>
@@ -1125,12 +1457,26 @@ def show_ai_assistant_page(user):
         with query_tab:
             query = st.text_input("Ask a financial question:", key="nl_query")
             
-            if st.button("Get Answer", key="query_button"):
+            button_col, refresh_col = st.columns([1, 1])
+            with button_col:
+                get_answer = st.button("Get Answer", key="query_button")
+            with refresh_col:
+                force_refresh = st.checkbox("Force refresh", key="query_force_refresh")
+            
+            if get_answer:
                 if txn_dicts:
                     with st.spinner("Processing with AI..."):
                         try:
-                            # Use async function to get answer
-                            answer_dict = asyncio.run(finance_agent.answer_question(query))
+                            # Reuse a previous answer to the same or a similar question
+                            answer_dict, embedding = (None, None) if force_refresh else find_cached_answer(user_id, query)
+                            
+                            if answer_dict is None:
+                                # Use async function to get answer
+                                answer_dict = run_async(agent.answer_question(query)).result()
+                                if "error" not in answer_dict:
+                                    if embedding is None:
+                                        embedding = finance_agent.embed(query.strip().lower())
+                                    store_cached_answer(user_id, query, embedding, answer_dict)
                             response = answer_dict.get("answer", "Unable to generate answer.")
                             relevant_ids = answer_dict.get("relevant_transactions", [])
                             
@@ -1156,10 +1502,12 @@ def show_ai_assistant_page(user):
                             # Display relevant transactions if any
                             if relevant_ids:
                                 st.subheader("Relevant Transactions")
-                                relevant_txns = [t for t in txn_dicts if t.get("id") in relevant_ids]
+                                relevant_txns = [txn_by_id[i] for i in relevant_ids if i in txn_by_id]
                                 if relevant_txns:
-                                    df = pd.DataFrame(relevant_txns)
-                                    st.dataframe(df[["date", "description", "amount", "category"]])
+                                    display_cols = ("date", "description", "amount", "category")
+                                    st.dataframe(_rows_to_arrow(tuple(
+                                        tuple((k, t.get(k)) for k in display_cols) for t in relevant_txns
+                                    )))
                         except Exception as e:
                             st.warning(f"Unable to process your query: {str(e)}")
                 else:
@@ -1173,19 +1521,27 @@ def show_ai_assistant_page(user):
                     with st.spinner("Searching with vector similarity..."):
                         try:
                             # Use vector search through finance agent
-                            search_results = finance_agent.search_transactions(search_query)
+                            search_results = agent.search_transactions(search_query)
                             
                             if search_results:
                                 st.success(f"Found {len(search_results)} matching transactions")
                                 
-                                # Convert to DataFrame for display
-                                result_df = pd.DataFrame(search_results)
+                                # Convert only the displayed fields to a DataFrame
+                                display_cols = ("date", "description", "amount", "category")
+                                display_df = pd.DataFrame([{k: r.get(k) for k in display_cols} for r in search_results])
                                 
-                                # Format for display
-                                display_df = result_df[["date", "description", "amount", "category"]]
-                                display_df = display_df.sort_values("date", ascending=False)
+                                # Format for display; unparseable dates show as blank instead of failing the search
+                                display_df["date"] = pd.to_datetime(display_df["date"], errors="coerce", cache=True)
+                                display_df.sort_values("date", ascending=False, inplace=True, kind="mergesort")
                                 
-                                st.dataframe(display_df, use_container_width=True)
+                                st.dataframe(
+                                    display_df,
+                                    column_config={
+                                        "date": TRANSACTION_COLUMN_CONFIG["Date"],
+                                        "amount": TRANSACTION_COLUMN_CONFIG["Amount"]
+                                    },
+                                    use_container_width=True
+                                )
                             else:
                                 st.info("No matching transactions found.")
                         except Exception as e:
@@ -1206,7 +1562,7 @@ def show_ai_assistant_page(user):
                     try:
                         if selected_insight == "Spending Patterns":
                             # Get spending anomalies
-                            anomalies = finance_agent.get_spending_anomalies()
+                            anomalies = agent.get_spending_anomalies()
                             
                             st.markdown("### Spending Anomalies")
                             if anomalies:
@@ -1225,7 +1581,7 @@ def show_ai_assistant_page(user):
                                 
                         elif selected_insight == "Budget Analysis":
                             # Get budget status
-                            budget_status = finance_agent.get_budget_status()
+                            budget_status = agent.get_budget_status()
                             
                             st.markdown("### Budget Status")
                             if budget_status:
@@ -1263,37 +1619,16 @@ def show_ai_assistant_page(user):
                             
                         elif selected_insight == "Financial Health":
                             # Get financial health score
-                            health = finance_agent.get_financial_health_score()
+                            health = agent.get_financial_health_score()
                             
                             st.markdown("### Financial Health Assessment")
                             score = health.get("score", 0)
                             details = health.get("details", {})
                             message = health.get("message", "No assessment available")
                             
-                            # Display score with a gauge chart
-                            fig = go.Figure(go.Indicator(
-                                mode = "gauge+number",
-                                value = score,
-                                domain = {'x': [0, 1], 'y': [0, 1]},
-                                title = {'text': "Financial Health Score"},
-                                gauge = {
-                                    'axis': {'range': [0, 100]},
-                                    'bar': {'color': "#4F8BF9"},
-                                    'steps' : [
-                                        {'range': [0, 40], 'color': "#FF5722"},
-                                        {'range': [40, 60], 'color': "#FF9800"},
-                                        {'range': [60, 80], 'color': "#8BC34A"},
-                                        {'range': [80, 100], 'color': "#4CAF50"}
-                                    ],
-                                    'threshold': {
-                                        'line': {'color': "white", 'width': 4},
-                                        'thickness': 0.75,
-                                        'value': score
-                                    }
-                                }
-                            ))
-                            
-                            fig.update_layout(height=300, margin=dict(l=10, r=10, t=50, b=10))
+                            # Display score with a gauge chart built from the shared template
+                            fig = go.Figure(get_health_gauge_template())
+                            fig.update_traces(value=score, gauge_threshold_value=score)
                             st.plotly_chart(fig, use_container_width=True)
                             
                             # Display assessment message
@@ -1354,27 +1689,19 @@ def show_settings_page(user):
         if st.button("Export All Data"):
             # Get user's data
             user_id = user["id"]
-            transactions = db.get_transactions(user_id)
             goals = db.get_goals(user_id)
             
             # Convert to dictionaries
-            txn_dicts = [t.to_dict() for t in transactions]
+            txn_dicts = list(db.iter_transaction_dicts(user_id))
             goal_dicts = [g.to_dict() for g in goals]
             
-            # Prepare data for export
-            export_data = {
-                "user_info": {
-                    "name": user["name"],
-                    "email": user["email"],
-                    "created_at": user["created_at"]
-                },
-                "transactions": txn_dicts,
-                "goals": goal_dicts,
-                "export_date": datetime.datetime.now().isoformat()
+            # Convert to JSON bytes (dates and decimals fall back to str)
+            user_info = {
+                "name": user["name"],
+                "email": user["email"],
+                "created_at": user["created_at"]
             }
-            
-            # Convert to JSON
-            export_json = json.dumps(export_data, indent=2)
+            export_json = _export_json_bytes(user_info, txn_dicts, goal_dicts, datetime.datetime.now())
             
             # Offer download
             st.download_button(
@@ -1385,27 +1712,72 @@ def show_settings_page(user):
             )
     
     with col2:
+        # Arm the reset so the confirmation survives the reruns it triggers
         if st.button("Reset All Data"):
+            st.session_state.reset_armed = True
+        
+        if st.session_state.get("reset_armed"):
             # Confirm deletion
             st.warning("⚠️ This will delete all your financial data and cannot be undone.")
             confirm = st.checkbox("I understand this will delete all my data")
             if confirm and st.button("Confirm Reset"):
+                st.session_state.reset_armed = False
+                
                 # Reset user's data using database operations
                 user_id = user["id"]
                 
                 # Delete all user data
                 try:
                     # Delete all user data with db transactions
-                    db.reset_user_data(user_id)
-                    
-                    # Process vector store cleanup
-                    vp.reset_user_vectors(user_id)
-                    
-                    st.success("All data has been reset!")
-                    # Refresh the page
-                    st.rerun()
+                    if db.reset_user_data(user_id):
+                        # Process vector store cleanup
+                        vp.reset_user_vectors(user_id)
+                        
+                        st.success("All data has been reset!")
+                        # Refresh the page
+                        invalidate_user_data(user_id)
+                        st.rerun()
+                    else:
+                        st.error("Failed to reset data. Please try again.")
                 except Exception as e:
                     st.error(f"Error resetting data: {str(e)}")
+            
+            if st.button("Cancel", key="cancel_reset"):
+                st.session_state.reset_armed = False
+                st.rerun()
+
+# Sidebar navigation pages and their icons
+NAV_OPTIONS = (
+    ("Dashboard", "📊"),
+    ("Transactions", "💸"),
+    ("Goals", "🎯"),
+    ("Budgets", "💰"),
+    ("Credit Management", "💳"),
+    ("Financial Coaching", "🧠"),
+    ("Crypto Finance", "🪙"),
+    ("AI Assistant", "🤖"),
+    ("Financial RAG", "🔍"),
+    ("Quantitative Finance", "📈"),
+    ("Finance Quiz", "🎮"),
+    ("Settings", "⚙️")
+)
+NAV_PAGES = tuple(page_name for page_name, _ in NAV_OPTIONS)
+NAV_ICONS = dict(NAV_OPTIONS)
+
+def _render_profile_html(user):
+    """Build the sidebar profile card for a user."""
+    return f"""
+            <div style="display: flex; align-items: center; margin-bottom: 1rem;">
+                <div style="width: 40px; height: 40px; border-radius: 50%; background-color: #7B61FF; 
+                           display: flex; align-items: center; justify-content: center; margin-right: 10px;">
+                    <span style="color: white; font-weight: bold;">{user['name'][0].upper()}</span>
+                </div>
+                <div>
+                    <div style="font-weight: bold;">{user['name']}</div>
+                    <div style="font-size: 0.8rem; opacity: 0.8;">{user['email']}</div>
+                </div>
+            </div>
+            """
 
 # Main app
 def main():
@@ -1417,16 +1789,16 @@ def main():
         
         # Display system status
         with st.expander("System Status", expanded=False):
-            # Check database connection
-            try:
-                db.get_db()
+            # Check database connection (cached briefly so navigation doesn't ping the DB)
+            db_error = check_db_connection()
+            if db_error is None:
                 st.success("Database: Connected")
-            except Exception as e:
-                st.error(f"Database Error: {str(e)}")
+            else:
+                st.error(f"Database Error: {db_error}")
             
             # Check vector engine
-            if hasattr(vector_processing.vector_engine, 'is_running') and \
-               vector_processing.vector_engine.is_running:
+            if hasattr(vp.vector_engine, 'is_running') and \
+               vp.vector_engine.is_running:
                 st.success("Vector Engine: Running")
             else:
                 st.warning("Vector Engine: Not Running")
@@ -1445,18 +1817,11 @@ def main():
         
         # User profile section
         with st.sidebar:
-            st.markdown(f"""
-            <div style="display: flex; align-items: center; margin-bottom: 1rem;">
-                <div style="width: 40px; height: 40px; border-radius: 50%; background-color: #7B61FF; 
-                           display: flex; align-items: center; justify-content: center; margin-right: 10px;">
-                    <span style="color: white; font-weight: bold;">{user['name'][0].upper()}</span>
-                </div>
-                <div>
-                    <div style="font-weight: bold;">{user['name']}</div>
-                    <div style="font-size: 0.8rem; opacity: 0.8;">{user['email']}</div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+            # Build the profile card once per user
+            if st.session_state.get("profile_uid") != user["id"]:
+                st.session_state.profile_html = _render_profile_html(user)
+                st.session_state.profile_uid = user["id"]
+            st.markdown(st.session_state.profile_html, unsafe_allow_html=True)
             
             # Logout button with improved styling
             if st.button("🚪 Logout", key="logout_btn"):
@@ -1469,37 +1834,14 @@ def main():
         with st.sidebar:
             st.markdown("### Navigation")
             
-            # Define navigation options with icons
-            nav_options = {
-                "Dashboard": "📊",
-                "Transactions": "💸",
-                "Goals": "🎯",
-                "Budgets": "💰",
-                "Credit Management": "💳",
-                "Financial Coaching": "🧠",
-                "Crypto Finance": "🪙",
-                "AI Assistant": "🤖",
-                "Financial RAG": "🔍",
-                "Quantitative Finance": "📈",
-                "Finance Quiz": "🎮",
-                "Settings": "⚙️"
-            }
-            
-            # Create styled navigation buttons
-            selected_page = None
-            for page_name, icon in nav_options.items():
-                if st.button(f"{icon} {page_name}", key=f"nav_{page_name}", use_container_width=True):
-                    selected_page = page_name
-            
-            # If no button is clicked, default to session state or Dashboard
-            if selected_page is None:
-                if "current_page" in st.session_state:
-                    selected_page = st.session_state.current_page
-                else:
-                    selected_page = "Dashboard"
-            
-            # Store current page in session state
-            st.session_state.current_page = selected_page
+            # Single navigation widget; its key keeps the current page in session state
+            selected_page = st.radio(
+                "Navigation",
+                NAV_PAGES,
+                format_func=lambda page_name: f"{NAV_ICONS[page_name]} {page_name}",
+                key="current_page",
+                label_visibility="collapsed"
+            )
             
             st.markdown("---")
         
@@ -1521,20 +1863,15 @@ def main():
             if submit_button:
                 if description and amount > 0:
                     try:
-                        # Set up finance agent for this user
                         user_id = user["id"]
-                        finance_agent.set_user(user_id)
-                        
-                        # Get AI categorization
-                        category = finance_agent.categorize_transaction(description)
                         
-                        # Create transaction data
+                        # Save right away; the AI category is filled in by the background enrichment
                         transaction_data = {
                             "date": transaction_date.strftime("%Y-%m-%d"),
                             "description": description,
                             "amount": float(amount),
                             "type": transaction_type.lower(),
-                            "category": category,
+                            "category": "Uncategorized",
                             "notes": ""
                         }
                         
@@ -1542,12 +1879,10 @@ def main():
                         new_transaction = db.create_transaction(user_id, transaction_data)
                         
                         if new_transaction:
-                            # Process with vector engine
-                            vp.process_new_transaction(new_transaction.to_dict())
-                            
-                            # Get insights about the transaction
-                            asyncio.run(finance_agent.analyze_transaction(new_transaction.id))
+                            # Categorize, index, and analyze off the request path
+                            enrich_transaction_in_background(user_id, new_transaction.id, description)
                             
+                            invalidate_user_data(user_id)
                             st.sidebar.success("Transaction added successfully!")
                         else:
                             st.sidebar.error("Failed to add transaction. Please try again.")
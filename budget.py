@@ -2,20 +2,164 @@ import datetime
 from typing import List, Dict, Any, Optional
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
+import numpy as np
+import orjson
 
 from db_manager import (
     load_budgets, 
     save_budgets, 
     add_budget, 
-    update_budget, 
-    delete_budget,
     get_category_spending,
     check_budget_status
 )
 from utils import format_currency
-from ai_agents import get_budget_status
+from utils.utils_core import budget_categories
+import db_service as db
+
+# Cached budget data, cleared after any budget change
+@st.cache_data(ttl=60, show_spinner=False)
+def get_budget_dashboard(user_id: str) -> Dict[str, Any]:
+    """
+    Load everything the budget page needs in one cached call.
+    
+    Args:
+        user_id: The user ID
+        
+    Returns:
+        Dictionary with the user's budgets, category spending, and budget status
+    """
+    budgets = load_budgets(user_id)
+    
+    return {
+        "budgets": budgets,
+        "spending": get_category_spending(user_id),
+        # Budget status is always empty without budgets, so skip the query
+        "status": check_budget_status(user_id) if budgets else []
+    }
+
+# USD fast path matching format_currency, with the sign added separately
+_CURRENCY_FORMAT = "${:,.2f}".format
+
+# Number of recent transactions included in the budget insights prompt
+BUDGET_PROMPT_TRANSACTIONS = 50
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_budget_insights(user_id: str, txn_ids: tuple, _prompt: str) -> str:
+    """Generate budget insights, cached per user and set of recent transactions."""
+    from ai_agents import generate_response
+    return generate_response(_prompt, "You are a financial advisor providing budget insights and recommendations.")
+
+def _clear_budget_caches(user_id: str):
+    """Clear cached budget data so the next rerun reloads it."""
+    get_budget_dashboard.clear()
+    db.invalidate_user_cache("budgets", user_id)
+
+def add_budgets_bulk(user_id: str, budgets_list: List[Dict[str, Any]]) -> int:
+    """
+    Add several budgets with a single write instead of one save per budget.
+    
+    Args:
+        user_id: The user ID
+        budgets_list: Budget dictionaries to append; entries without a positive amount are skipped
+        
+    Returns:
+        Number of budgets created
+    """
+    # Drop entries whose amount is missing, NaN, or not positive
+    amounts = pd.to_numeric(pd.Series([b.get("amount") for b in budgets_list], dtype=object), errors="coerce")
+    budgets_list = [b for b, valid in zip(budgets_list, amounts > 0) if valid]
+    if not budgets_list:
+        return 0
+    
+    budgets = list(load_budgets(user_id))
+    budgets.extend(budgets_list)
+    
+    return len(budgets_list) if save_budgets(user_id, budgets) else 0
+
+def _apply_budget_edits(budgets: List[Dict[str, Any]], original_df: pd.DataFrame, edited_df: pd.DataFrame) -> Optional[List[Dict[str, Any]]]:
+    """
+    Return the budgets with table edits and deletions applied, or None if nothing changed.
+    
+    Raises:
+        ValueError: If a kept row has a cleared or non-positive amount
+    """
+    fields = ["Amount", "Period", "Notes"]
+    edited_df = edited_df.fillna({"Notes": ""})
+    changed = (edited_df[fields] != original_df[fields]).any(axis=1)
+    deleted = edited_df["Delete"].astype(bool)
+    
+    # A cleared Amount cell comes back as NaN; never write it as a budget amount
+    invalid = ~deleted & (edited_df["Amount"].isna() | (edited_df["Amount"] <= 0))
+    if invalid.any():
+        categories = ", ".join(edited_df.loc[invalid, "Category"].astype(str))
+        raise ValueError(f"Enter an amount greater than zero for: {categories}")
+    
+    if not (changed | deleted).any():
+        return None
+    
+    updated_at = datetime.datetime.now().isoformat()
+    updated_budgets = []
+    for budget, row, is_changed, is_deleted in zip(budgets, edited_df.itertuples(index=False), changed, deleted):
+        if is_deleted:
+            continue
+        if is_changed:
+            budget = {
+                **budget,
+                "amount": float(row.Amount),
+                "period": row.Period.lower(),
+                "notes": row.Notes,
+                "updated_at": updated_at
+            }
+        updated_budgets.append(budget)
+    
+    return updated_budgets
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _build_budget_fig(budget_rows):
+    """Build the budget vs. actual bar chart from (category, budget, spent, percent_used) rows."""
+    import plotly.graph_objects as go
+    
+    df = pd.DataFrame(list(budget_rows), columns=["category", "budget", "spent", "percent_used"])
+    percent_used = df["percent_used"].to_numpy()
+    
+    # Create horizontal bar chart
+    fig = go.Figure()
+    
+    # Add budget bars (background)
+    fig.add_trace(go.Bar(
+        y=df["category"],
+        x=df["budget"],
+        name="Budget",
+        orientation="h",
+        marker=dict(color="rgba(200, 200, 200, 0.5)"),
+        hovertemplate="Budget: %{x:$,.2f}<extra></extra>"
+    ))
+    
+    # Add spent bars (foreground)
+    fig.add_trace(go.Bar(
+        y=df["category"],
+        x=df["spent"],
+        name="Spent",
+        orientation="h",
+        marker=dict(color=np.select(
+            [percent_used >= 100, percent_used >= 90],
+            ["red", "orange"],
+            default="rgba(63, 81, 181, 0.8)"
+        )),
+        hovertemplate="Spent: %{x:$,.2f}<extra></extra>"
+    ))
+    
+    # Update layout
+    fig.update_layout(
+        title="Budget vs. Actual Spending",
+        barmode="overlay",
+        xaxis=dict(title="Amount ($)"),
+        yaxis=dict(title="Category", autorange="reversed"),
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        margin=dict(t=60, l=20, r=20, b=40)
+    )
+    
+    return fig
 
 def budget_management_page(user_id: str):
     """
@@ -26,28 +170,34 @@ def budget_management_page(user_id: str):
     """
     st.title("Budget Management")
     
-    # Load user budgets
-    budgets = load_budgets(user_id)
+    # Load budgets, spending, and status once for all tabs
+    dashboard = get_budget_dashboard(user_id)
+    budgets = dashboard["budgets"]
+    category_spending = dashboard["spending"]
+    budget_status = dashboard["status"]
     
     # Create tabs
     tab1, tab2, tab3 = st.tabs(["Budget Overview", "Create/Edit Budgets", "Smart Budget Analysis"])
     
     with tab1:
-        display_budget_overview(user_id, budgets)
+        display_budget_overview(user_id, budgets, category_spending, budget_status)
     
     with tab2:
-        manage_budgets(user_id, budgets)
+        manage_budgets(user_id, budgets, category_spending)
     
     with tab3:
-        smart_budget_analysis(user_id, budgets)
+        smart_budget_analysis(user_id, budgets, category_spending)
 
-def display_budget_overview(user_id: str, budgets: List[Dict[str, Any]]):
+def display_budget_overview(user_id: str, budgets: List[Dict[str, Any]], category_spending: Dict[str, float],
+                            budget_status: List[Dict[str, Any]]):
     """
     Display the budget overview tab.
     
     Args:
         user_id (str): The user ID
         budgets (List[Dict]): List of budget dictionaries
+        category_spending (Dict[str, float]): Spending by category
+        budget_status (List[Dict]): Budget warnings for the user
     """
     st.subheader("Budget Overview")
     
@@ -55,12 +205,6 @@ def display_budget_overview(user_id: str, budgets: List[Dict[str, Any]]):
         st.info("You haven't set up any budgets yet. Go to the 'Create/Edit Budgets' tab to get started.")
         return
     
-    # Get current month spending by category
-    category_spending = get_category_spending(user_id)
-    
-    # Check budget status
-    budget_status = check_budget_status(user_id)
-    
     # Display budget warnings
     if budget_status:
         st.warning("Budget Alerts")
@@ -86,74 +230,32 @@ def display_budget_overview(user_id: str, budgets: List[Dict[str, Any]]):
     # Display budget vs. actual spending chart
     st.subheader("Budget vs. Actual Spending")
     
-    # Prepare data for chart
-    budget_data = []
+    # Prepare data for chart as parallel arrays
+    categories = np.array([b.get("category") or "Uncategorized" for b in budgets], dtype=object)
+    limits = np.array([b.get("amount") or 0 for b in budgets], dtype=float)
     
-    for budget in budgets:
-        category = budget.get("category", "Uncategorized")
-        limit = budget.get("amount", 0)
-        
-        # Get actual spending for this category
-        if category == "All Categories":
-            spent = sum(category_spending.values())
-        else:
-            spent = category_spending.get(category, 0)
-        
-        # Calculate percentage and remaining amount
-        percent_used = (spent / limit * 100) if limit > 0 else 0
-        remaining = max(0, limit - spent)
-        
-        budget_data.append({
-            "category": category,
-            "budget": limit,
-            "spent": spent,
-            "remaining": remaining,
-            "percent_used": percent_used
-        })
+    # Get actual spending for each category
+    spent = np.array([category_spending.get(c, 0) for c in categories], dtype=float)
+    spent[categories == "All Categories"] = sum(category_spending.values())
     
-    # Sort by percent used (descending)
-    budget_data.sort(key=lambda x: x["percent_used"], reverse=True)
+    # Calculate remaining amount and percentage
+    remaining = np.clip(limits - spent, 0, None)
+    percent_used = np.divide(spent * 100, limits, out=np.zeros_like(spent), where=limits > 0)
     
-    # Create dataframe for chart
-    df = pd.DataFrame(budget_data)
+    # Sort by percent used (descending), keeping ties in budget order
+    order = np.argsort(-percent_used, kind="stable")
+    df = pd.DataFrame({
+        "category": categories[order],
+        "budget": limits[order],
+        "spent": spent[order],
+        "remaining": remaining[order],
+        "percent_used": percent_used[order]
+    })
     
     if not df.empty:
-        # Create horizontal bar chart
-        fig = go.Figure()
-        
-        # Add budget bars (background)
-        fig.add_trace(go.Bar(
-            y=df["category"],
-            x=df["budget"],
-            name="Budget",
-            orientation="h",
-            marker=dict(color="rgba(200, 200, 200, 0.5)"),
-            hovertemplate="Budget: %{x:$,.2f}<extra></extra>"
-        ))
-        
-        # Add spent bars (foreground)
-        fig.add_trace(go.Bar(
-            y=df["category"],
-            x=df["spent"],
-            name="Spent",
-            orientation="h",
-            marker=dict(
-                color=df["percent_used"].apply(
-                    lambda x: "red" if x >= 100 else "orange" if x >= 90 else "rgba(63, 81, 181, 0.8)"
-                )
-            ),
-            hovertemplate="Spent: %{x:$,.2f}<extra></extra>"
-        ))
-        
-        # Update layout
-        fig.update_layout(
-            title="Budget vs. Actual Spending",
-            barmode="overlay",
-            xaxis=dict(title="Amount ($)"),
-            yaxis=dict(title="Category", autorange="reversed"),
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-            margin=dict(t=60, l=20, r=20, b=40)
-        )
+        # Build (or reuse) the horizontal bar chart
+        budget_rows = tuple(df[["category", "budget", "spent", "percent_used"]].itertuples(index=False, name=None))
+        fig = _build_budget_fig(budget_rows)
         
         st.plotly_chart(fig, use_container_width=True)
         
@@ -162,10 +264,11 @@ def display_budget_overview(user_id: str, budgets: List[Dict[str, Any]]):
         
         # Format dataframe for display
         display_df = df.copy()
-        display_df["budget"] = display_df["budget"].apply(format_currency)
-        display_df["spent"] = display_df["spent"].apply(format_currency)
-        display_df["remaining"] = display_df["remaining"].apply(format_currency)
-        display_df["percent_used"] = display_df["percent_used"].apply(lambda x: f"{x:.1f}%")
+        for column in ("budget", "spent", "remaining"):
+            amounts = display_df[column]
+            formatted = amounts.abs().map(_CURRENCY_FORMAT)
+            display_df[column] = formatted.mask(amounts < 0, "-" + formatted)
+        display_df["percent_used"] = display_df["percent_used"].round(1).astype(str) + "%"
         
         # Rename columns for display
         display_df.columns = ["Category", "Budget", "Spent", "Remaining", "% Used"]
@@ -175,20 +278,22 @@ def display_budget_overview(user_id: str, budgets: List[Dict[str, Any]]):
     else:
         st.info("No budget data available to display.")
 
-def manage_budgets(user_id: str, budgets: List[Dict[str, Any]]):
+def manage_budgets(user_id: str, budgets: List[Dict[str, Any]], category_spending: Dict[str, float]):
     """
     Display the budget management tab.
     
     Args:
         user_id (str): The user ID
         budgets (List[Dict]): List of budget dictionaries
+        category_spending (Dict[str, float]): Spending by category
     """
     st.subheader("Create New Budget")
     
     # Get available categories
-    from utils.utils_core import budget_categories
-    available_categories = ["All Categories"] + budget_categories + list(get_category_spending(user_id).keys())
-    available_categories = list(dict.fromkeys(available_categories))  # Remove duplicates
+    seen = {"All Categories": None}
+    seen.update(dict.fromkeys(budget_categories))
+    seen.update(dict.fromkeys(category_spending))
+    available_categories = list(seen)
     
     # Create new budget form
     with st.form("budget_form"):
@@ -206,9 +311,9 @@ def manage_budgets(user_id: str, budgets: List[Dict[str, Any]]):
         
         if submit:
             # Check if budget for this category already exists
-            category_exists = any(b.get("category") == category for b in budgets)
+            existing_categories = {b.get("category") for b in budgets}
             
-            if category_exists:
+            if category in existing_categories:
                 st.error(f"A budget for {category} already exists. Please edit the existing budget instead.")
             else:
                 # Create new budget
@@ -225,6 +330,7 @@ def manage_budgets(user_id: str, budgets: List[Dict[str, Any]]):
                 if success:
                     st.success(f"Budget for {category} added successfully!")
                     # Refresh budgets
+                    _clear_budget_caches(user_id)
                     st.rerun()
                 else:
                     st.error("Failed to add budget. Please try again.")
@@ -235,84 +341,65 @@ def manage_budgets(user_id: str, budgets: List[Dict[str, Any]]):
     if not budgets:
         st.info("You haven't set up any budgets yet.")
     else:
-        for i, budget in enumerate(budgets):
-            with st.expander(f"{budget.get('category', 'Uncategorized')} - {format_currency(budget.get('amount', 0))} ({budget.get('period', 'monthly').title()})"):
-                with st.form(f"edit_budget_{i}"):
-                    amount = st.number_input(
-                        "Budget Amount", 
-                        min_value=0.01, 
-                        step=10.0, 
-                        value=float(budget.get("amount", 0))
-                    )
-                    
-                    time_period = st.selectbox(
-                        "Time Period", 
-                        ["Monthly", "Weekly", "Yearly"],
-                        index=0 if budget.get("period") == "monthly" else 
-                              1 if budget.get("period") == "weekly" else 2
-                    )
-                    
-                    notes = st.text_area(
-                        "Notes (Optional)",
-                        value=budget.get("notes", "")
-                    )
-                    
-                    col1, col2 = st.columns(2)
-                    
-                    with col1:
-                        update = st.form_submit_button("Update Budget")
-                    
-                    with col2:
-                        delete = st.form_submit_button("Delete Budget")
-                    
-                    if update:
-                        # Update budget
-                        updated_budget = budget.copy()
-                        updated_budget.update({
-                            "amount": float(amount),
-                            "period": time_period.lower(),
-                            "notes": notes,
-                            "updated_at": datetime.datetime.now().isoformat()
-                        })
-                        
-                        success = update_budget(user_id, i, updated_budget)
-                        
-                        if success:
-                            st.success("Budget updated successfully!")
-                            # Refresh budgets
-                            st.rerun()
-                        else:
-                            st.error("Failed to update budget. Please try again.")
-                    
-                    if delete:
-                        # Delete budget
-                        success = delete_budget(user_id, i)
-                        
-                        if success:
-                            st.success("Budget deleted successfully!")
-                            # Refresh budgets
-                            st.rerun()
-                        else:
-                            st.error("Failed to delete budget. Please try again.")
+        # Edit all budgets in one table and save them with a single write
+        editor_df = pd.DataFrame({
+            "Category": [b.get("category", "Uncategorized") for b in budgets],
+            "Amount": [float(b.get("amount", 0)) for b in budgets],
+            "Period": [b.get("period", "monthly").title() for b in budgets],
+            "Notes": [b.get("notes", "") or "" for b in budgets],
+            "Delete": False
+        })
+        
+        with st.form("edit_budgets_form"):
+            edited_df = st.data_editor(
+                editor_df,
+                key="budget_editor",
+                hide_index=True,
+                use_container_width=True,
+                disabled=["Category"],
+                column_config={
+                    "Amount": st.column_config.NumberColumn("Amount", min_value=0.01, step=10.0, format="$%.2f"),
+                    "Period": st.column_config.SelectboxColumn("Period", options=["Monthly", "Weekly", "Yearly"], required=True),
+                    "Delete": st.column_config.CheckboxColumn("Delete")
+                }
+            )
+            
+            save = st.form_submit_button("Save Changes")
+        
+        if save:
+            try:
+                updated_budgets = _apply_budget_edits(budgets, editor_df, edited_df)
+            except ValueError as e:
+                st.error(str(e))
+                return
+            
+            if updated_budgets is None:
+                st.info("No changes to save.")
+            elif save_budgets(user_id, updated_budgets):
+                st.success("Budgets updated successfully!")
+                # Refresh budgets
+                _clear_budget_caches(user_id)
+                st.rerun()
+            else:
+                st.error("Failed to update budgets. Please try again.")
 
-def smart_budget_analysis(user_id: str, budgets: List[Dict[str, Any]]):
+def smart_budget_analysis(user_id: str, budgets: List[Dict[str, Any]], category_spending: Dict[str, float]):
     """
     Display the smart budget analysis tab.
     
     Args:
         user_id (str): The user ID
         budgets (List[Dict]): List of budget dictionaries
+        category_spending (Dict[str, float]): Spending by category
     """
     st.subheader("Smart Budget Analysis")
     
-    # Get spending data
-    category_spending = get_category_spending(user_id)
-    
     if not category_spending:
         st.info("Add some transactions to get AI-powered budget analysis.")
         return
     
     # Display spending breakdown chart
+    import plotly.express as px
     fig = px.pie(
         names=list(category_spending.keys()),
         values=list(category_spending.values()),
@@ -331,16 +418,15 @@ def smart_budget_analysis(user_id: str, budgets: List[Dict[str, Any]]):
     
     with st.spinner("Generating smart budget recommendations..."):
         try:
-            # Create a transactions list to pass to the AI
-            from db_manager import load_transactions
-            transactions = load_transactions(user_id)
+            # Pass only the most recent transactions to the AI
+            transactions = [t.to_dict() for t in db.get_recent_transactions(user_id, BUDGET_PROMPT_TRANSACTIONS)]
             
             if transactions:
                 # Get AI-powered budget recommendations
-                from ai_agents import generate_response
-                
-                budget_prompt = f"Based on these transactions, provide budget insights and recommendations: {str(transactions)[:1000]}"
-                budget_insights = generate_response(budget_prompt, "You are a financial advisor providing budget insights and recommendations.")
+                transactions_json = orjson.dumps(transactions, default=str).decode()[:2000]
+                budget_prompt = f"Based on these transactions, provide budget insights and recommendations: {transactions_json}"
+                txn_ids = tuple(t.get("id") for t in transactions)
+                budget_insights = _cached_budget_insights(user_id, txn_ids, budget_prompt)
                 st.info(budget_insights)
                 
                 # Show budget optimization options
@@ -371,27 +457,26 @@ def smart_budget_analysis(user_id: str, budgets: List[Dict[str, Any]]):
                 # One-click budget creation
                 if st.button("Create Suggested Budgets"):
                     # Check which budgets already exist
-                    existing_categories = [b.get("category") for b in budgets]
-                    budgets_created = 0
+                    existing_categories = {b.get("category") for b in budgets}
+                    created_at = datetime.datetime.now().isoformat()
+                    to_create = [
+                        {
+                            "category": category,
+                            "amount": float(amount),
+                            "period": "monthly",
+                            "notes": "Auto-created from AI suggestion",
+                            "created_at": created_at
+                        }
+                        for category, amount in suggested_budgets.items()
+                        if category not in existing_categories
+                    ]
                     
-                    for category, amount in suggested_budgets.items():
-                        if category not in existing_categories:
-                            # Create new budget
-                            new_budget = {
-                                "category": category,
-                                "amount": float(amount),
-                                "period": "monthly",
-                                "notes": "Auto-created from AI suggestion",
-                                "created_at": datetime.datetime.now().isoformat()
-                            }
-                            
-                            success = add_budget(user_id, new_budget)
-                            if success:
-                                budgets_created += 1
+                    budgets_created = add_budgets_bulk(user_id, to_create)
                     
                     if budgets_created > 0:
                         st.success(f"Created {budgets_created} new budgets successfully!")
                         # Refresh budgets
+                        _clear_budget_caches(user_id)
                         st.rerun()
                     else:
                         st.info("No new budgets created. All suggested categories already have budgets.")
@@ -2,13 +2,229 @@ import streamlit as st
 import plotly.graph_objects as go
 import plotly.express as px
 import pandas as pd
+import numpy as np
+import os
 import datetime
-import random  # For demo purposes
+import hashlib
+import diskcache
+from pathlib import Path
 from typing import Dict, List, Any, Optional
 
 from utils import format_currency
 import ai_agents
 
+# Display color for each credit factor status
+STATUS_COLOR = {
+    "Excellent": "green",
+    "Very Good": "lightgreen",
+    "Good": "gold",
+    "Fair": "orange",
+    "Poor": "red"
+}
+
+# Display labels for the payment calendar's payment columns
+PAYMENT_TYPE_LABELS = {
+    "optimal_payment": "Optimal Payment",
+    "min_payment": "Minimum Payment"
+}
+
+# Sort order for payment recommendation impact levels
+IMPACT_RANK = {"High": 0, "Medium": 1, "Low": 2}
+
+# Credit score category bands: lower bounds of each band above "Poor"
+SCORE_THRESHOLDS = np.array([580, 670, 740, 800])
+SCORE_LABELS = ["Poor", "Fair", "Good", "Very Good", "Excellent"]
+SCORE_COLORS = ["red", "orange", "yellow", "lightgreen", "green"]
+GAUGE_STEP_COLORS = ["firebrick", "darkorange", "gold", "yellowgreen", "green"]
+
+# Shared generator for demo data
+_rng = np.random.default_rng()
+
+# Demo score history drop ranges (low inclusive, high exclusive), oldest month first
+HISTORY_DROP_LOW = np.array([5, 3, 0, 0, -3, 0])
+HISTORY_DROP_HIGH = np.array([16, 11, 9, 6, 4, 1])
+
+def _gen_history(scores, seed: Optional[int] = None) -> np.ndarray:
+    """Generate demo score histories, one row per score, oldest month first."""
+    rng = _rng if seed is None else np.random.default_rng(seed)
+    scores = np.atleast_1d(np.asarray(scores, dtype=np.int64))
+    drops = rng.integers(HISTORY_DROP_LOW, HISTORY_DROP_HIGH, size=(len(scores), len(HISTORY_DROP_LOW)))
+    return scores[:, None] - drops
+
+# AI responses persisted on disk so they survive server restarts; CREDIT_CACHE_DIR overrides the location
+AI_CACHE_DIR = os.environ.get("CREDIT_CACHE_DIR", str(Path(__file__).resolve().parent / ".credit_cache"))
+AI_CACHE_EXPIRE = 86400
+_ai_disk_cache = diskcache.Cache(AI_CACHE_DIR, size_limit=int(2e9))
+
+class _EmptyAIResponse(Exception):
+    """Raised inside the memoized call so a failed AI response is never cached."""
+
+# AI responses are cached per user and method so reruns and tab switches don't re-query
+@st.cache_data(ttl=3600, show_spinner=False)
+def _memoized_structured_response(user_id: str, method_name: str, prompt: str, system_prompt: str):
+    """Return a successful AI response from memory, disk, or the API, raising _EmptyAIResponse otherwise."""
+    key = (
+        user_id,
+        method_name,
+        hashlib.sha256(prompt.encode()).hexdigest(),
+        hashlib.sha256(system_prompt.encode()).hexdigest()
+    )
+    response = _ai_disk_cache.get(key)
+    if response is None:
+        response = ai_agents.generate_structured_response(prompt, system_prompt=system_prompt)
+        # Failures raise so neither cache layer keeps them and the next call retries
+        if not response:
+            raise _EmptyAIResponse()
+        _ai_disk_cache.set(key, response, expire=AI_CACHE_EXPIRE)
+    return response
+
+def _cached_structured_response(user_id: str, method_name: str, prompt: str, system_prompt: str):
+    """Return the cached AI response, or None so callers fall back to demo data."""
+    try:
+        return _memoized_structured_response(user_id, method_name, prompt, system_prompt)
+    except _EmptyAIResponse:
+        return None
+
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def _score_gauge(score: int, category: str, color: str):
+    """Build the credit score gauge."""
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=score,
+        domain={'x': [0, 1], 'y': [0, 1]},
+        title={'text': f"Credit Score: {category}"},
+        gauge={
+            'axis': {'range': [300, 850], 'tickwidth': 1, 'tickcolor': "darkblue"},
+            'bar': {'color': color},
+            'bgcolor': "white",
+            'borderwidth': 2,
+            'bordercolor': "gray",
+            'steps': [
+                {'range': [low, high], 'color': step_color}
+                for low, high, step_color in zip([300, *SCORE_THRESHOLDS.tolist()], [*SCORE_THRESHOLDS.tolist(), 850], GAUGE_STEP_COLORS)
+            ],
+            'threshold': {
+                'line': {'color': "darkblue", 'width': 4},
+                'thickness': 0.75,
+                'value': score
+            }
+        }
+    ))
+    
+    fig.update_layout(
+        height=300,
+        margin=dict(l=20, r=20, t=50, b=20)
+    )
+    
+    return fig
+
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def _score_history_chart(history_df: pd.DataFrame):
+    """Build the credit score trend line chart."""
+    fig = px.line(
+        history_df, 
+        x="date", 
+        y="score",
+        markers=True,
+        title="Score Trend Over Time"
+    )
+    
+    fig.update_layout(
+        xaxis_title="Date",
+        yaxis_title="Credit Score",
+        yaxis=dict(range=[min(history_df["score"]) - 20, 850])
+    )
+    
+    return fig
+
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def _utilization_bar_chart(account_df: pd.DataFrame):
+    """Build the per-account utilization bar chart with its 30% target line."""
+    fig = px.bar(
+        account_df,
+        x="name",
+        y="utilization",
+        color="color",
+        color_discrete_map={"green": "green", "orange": "orange", "red": "red"},
+        title="Utilization by Account",
+        labels={"name": "Account", "utilization": "Utilization (%)"},
+        text="utilization"
+    )
+    
+    fig.update_traces(
+        texttemplate="%{y:.1f}%", 
+        textposition="outside"
+    )
+    
+    fig.update_layout(
+        yaxis=dict(range=[0, max(account_df["utilization"]) * 1.2]),
+        showlegend=False
+    )
+    
+    # Add a horizontal line at 30%
+    fig.add_shape(
+        type="line",
+        x0=-0.5,
+        x1=len(account_df) - 0.5,
+        y0=30,
+        y1=30,
+        line=dict(color="green", width=2, dash="dash")
+    )
+    
+    fig.add_annotation(
+        x=len(account_df) - 1,
+        y=35,
+        text="Target: 30%",
+        showarrow=False,
+        font=dict(color="green")
+    )
+    
+    return fig
+
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def _balance_pie_chart(account_df: pd.DataFrame):
+    """Build the account balance distribution pie chart."""
+    fig = px.pie(
+        account_df,
+        values="balance",
+        names="name",
+        title="Balance Distribution",
+        hole=0.4
+    )
+    
+    fig.update_traces(
+        textposition="inside",
+        textinfo="percent+label",
+        hovertemplate="%{label}: %{value:$,.2f} (%{percent})"
+    )
+    
+    return fig
+
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def _payment_schedule_chart(payment_df: pd.DataFrame):
+    """Build the grouped optimal vs. minimum payment bar chart."""
+    fig = px.bar(
+        payment_df,
+        x="Date",
+        y="Amount",
+        color="Type",
+        barmode="group",
+        title="Payment Schedule",
+        color_discrete_map={
+            "Optimal Payment": "green",
+            "Minimum Payment": "lightgray"
+        },
+        hover_data=["Account", "Impact"]
+    )
+    
+    fig.update_layout(
+        xaxis_title="Date",
+        yaxis_title="Payment Amount ($)",
+        legend_title="Payment Type"
+    )
+    
+    return fig
+
 class CreditManager:
     def __init__(self, user_id: str):
         """
@@ -18,6 +234,11 @@ class CreditManager:
             user_id (str): The user ID
         """
         self.user_id = user_id
+        self._score_cache = None
+    
+    def _generate(self, method_name: str, prompt: str, system_prompt: str):
+        """Return the cached AI response for one of this manager's prompts."""
+        return _cached_structured_response(self.user_id, method_name, prompt, system_prompt)
         
     def get_credit_score(self) -> Dict[str, Any]:
         """
@@ -26,11 +247,18 @@ class CreditManager:
         Returns:
             Dict: Credit score information
         """
+        if self._score_cache is None:
+            self._score_cache = self._load_credit_score()
+        return self._score_cache
+    
+    def _load_credit_score(self) -> Dict[str, Any]:
+        """Fetch the credit assessment, falling back to demo data."""
         # In a real implementation, this would pull from a credit API
         # For demo, we'll generate a simulated credit score
         
         # Ask AI for assessment based on transactions and financial behavior
-        credit_assessment = ai_agents.generate_structured_response(
+        credit_assessment = self._generate(
+            "get_credit_score",
             f"Based on user {self.user_id}'s financial behaviors, generate a detailed credit assessment",
             system_prompt="You are a credit analysis expert. Generate a realistic credit assessment with score, factors, and recommendations."
         )
@@ -38,44 +266,24 @@ class CreditManager:
         # If AI fails, use demo data
         if not credit_assessment:
             # Demo data
-            score = random.randint(650, 850)
+            now = datetime.datetime.now()
+            score = int(_rng.integers(650, 851))
+            factor_scores = _rng.integers([70, 60, 65, 75, 80], [101, 96, 101, 101, 101]).tolist()
             
-            # Calculate score category
-            if score >= 800:
-                category = "Excellent"
-                color = "green"
-            elif score >= 740:
-                category = "Very Good"
-                color = "lightgreen" 
-            elif score >= 670:
-                category = "Good"
-                color = "yellow"
-            elif score >= 580:
-                category = "Fair"
-                color = "orange"
-            else:
-                category = "Poor"
-                color = "red"
+            # Score history every 30 days up to today, with random drops below the current score
+            dates = pd.date_range(end=now, periods=len(HISTORY_DROP_LOW), freq="30D").strftime("%Y-%m-%d")
+            history = [{"date": date, "score": int(value)} for date, value in zip(dates, _gen_history(score)[0])]
                 
-            return {
+            credit_assessment = {
                 "score": score,
-                "category": category,
-                "color": color,
                 "factors": [
-                    {"name": "Payment History", "impact": "High", "status": "Good", "score": random.randint(70, 100)},
-                    {"name": "Credit Utilization", "impact": "High", "status": "Fair", "score": random.randint(60, 95)},
-                    {"name": "Credit Age", "impact": "Medium", "status": "Good", "score": random.randint(65, 100)},
-                    {"name": "Credit Mix", "impact": "Low", "status": "Very Good", "score": random.randint(75, 100)},
-                    {"name": "Recent Inquiries", "impact": "Low", "status": "Excellent", "score": random.randint(80, 100)}
-                ],
-                "history": [
-                    {"date": (datetime.datetime.now() - datetime.timedelta(days=150)).strftime("%Y-%m-%d"), "score": score - random.randint(5, 15)},
-                    {"date": (datetime.datetime.now() - datetime.timedelta(days=120)).strftime("%Y-%m-%d"), "score": score - random.randint(3, 10)},
-                    {"date": (datetime.datetime.now() - datetime.timedelta(days=90)).strftime("%Y-%m-%d"), "score": score - random.randint(0, 8)},
-                    {"date": (datetime.datetime.now() - datetime.timedelta(days=60)).strftime("%Y-%m-%d"), "score": score - random.randint(0, 5)},
-                    {"date": (datetime.datetime.now() - datetime.timedelta(days=30)).strftime("%Y-%m-%d"), "score": score - random.randint(-3, 3)},
-                    {"date": datetime.datetime.now().strftime("%Y-%m-%d"), "score": score}
+                    {"name": "Payment History", "impact": "High", "status": "Good", "score": factor_scores[0]},
+                    {"name": "Credit Utilization", "impact": "High", "status": "Fair", "score": factor_scores[1]},
+                    {"name": "Credit Age", "impact": "Medium", "status": "Good", "score": factor_scores[2]},
+                    {"name": "Credit Mix", "impact": "Low", "status": "Very Good", "score": factor_scores[3]},
+                    {"name": "Recent Inquiries", "impact": "Low", "status": "Excellent", "score": factor_scores[4]}
                 ],
+                "history": history,
                 "recommendations": [
                     "Consider paying down high-interest debt first",
                     "Maintain low credit card balances (below 30% of limit)",
@@ -85,6 +293,18 @@ class CreditManager:
                 ]
             }
         
+        # Fill in any headline fields the assessment left out so callers can index directly.
+        # AI payloads may send the score as a string, so normalize it to an int on the gauge's scale
+        try:
+            score = int(float(credit_assessment.get("score", 650)))
+        except (TypeError, ValueError):
+            score = 650
+        score = min(max(score, 300), 850)
+        credit_assessment["score"] = score
+        band = int(np.searchsorted(SCORE_THRESHOLDS, score, side="right"))
+        credit_assessment.setdefault("category", SCORE_LABELS[band])
+        credit_assessment.setdefault("color", SCORE_COLORS[band])
+        
         return credit_assessment
         
     def analyze_credit_utilization(self) -> Dict[str, Any]:
@@ -97,7 +317,8 @@ class CreditManager:
         # In a real implementation, this would pull from actual credit accounts
         # For demo, we'll generate simulated credit accounts
         
-        credit_analysis = ai_agents.generate_structured_response(
+        credit_analysis = self._generate(
+            "analyze_credit_utilization",
             f"Based on user {self.user_id}'s financial data, analyze their credit utilization",
             system_prompt="You are a credit utilization expert. Generate a detailed analysis with account breakdowns and recommendations."
         )
@@ -111,8 +332,10 @@ class CreditManager:
                 {"name": "Credit Line", "limit": 15000, "balance": 3000, "utilization": 20.0}
             ]
             
-            total_limit = sum(a["limit"] for a in accounts)
-            total_balance = sum(a["balance"] for a in accounts)
+            limits = np.fromiter((a["limit"] for a in accounts), dtype=np.int64, count=len(accounts))
+            balances = np.fromiter((a["balance"] for a in accounts), dtype=np.int64, count=len(accounts))
+            total_limit = int(limits.sum())
+            total_balance = int(balances.sum())
             overall_utilization = (total_balance / total_limit) * 100 if total_limit > 0 else 0
             
             return {
@@ -139,20 +362,22 @@ class CreditManager:
             List[Dict]: Payment recommendations
         """
         # Generate payment recommendations using AI
-        recommendations = ai_agents.generate_structured_response(
+        recommendations = self._generate(
+            "get_payment_recommendations",
             f"Based on user {self.user_id}'s current accounts and credit status, provide payment optimization recommendations",
             system_prompt="You are a payment strategy expert. Generate actionable recommendations for improving credit through optimal payment timing and amounts."
         )
         
         # If AI fails, use demo data
         if not recommendations or not isinstance(recommendations, list):
+            now = datetime.datetime.now()
             return [
                 {
                     "account": "Credit Card 2",
                     "current_balance": 2200,
                     "min_payment": 44,
                     "optimal_payment": 500,
-                    "due_date": (datetime.datetime.now() + datetime.timedelta(days=8)).strftime("%Y-%m-%d"),
+                    "due_date": (now + datetime.timedelta(days=8)).strftime("%Y-%m-%d"),
                     "recommendation": "Pay $500 on or before due date to reduce utilization below 20%",
                     "impact": "Medium"
                 },
@@ -161,7 +386,7 @@ class CreditManager:
                     "current_balance": 950,
                     "min_payment": 35,
                     "optimal_payment": 400,
-                    "due_date": (datetime.datetime.now() + datetime.timedelta(days=12)).strftime("%Y-%m-%d"),
+                    "due_date": (now + datetime.timedelta(days=12)).strftime("%Y-%m-%d"),
                     "recommendation": "Pay $400 to bring utilization below 30% threshold",
                     "impact": "High"
                 },
@@ -170,7 +395,7 @@ class CreditManager:
                     "current_balance": 1250,
                     "min_payment": 25,
                     "optimal_payment": 250,
-                    "due_date": (datetime.datetime.now() + datetime.timedelta(days=15)).strftime("%Y-%m-%d"),
+                    "due_date": (now + datetime.timedelta(days=15)).strftime("%Y-%m-%d"),
                     "recommendation": "Schedule payment now to ensure it posts before statement date",
                     "impact": "Low"
                 }
@@ -185,8 +410,12 @@ class CreditManager:
         Returns:
             Dict: Credit improvement plan
         """
+        # Current score comes from the instance cache, so this costs no extra AI call
+        score = self.get_credit_score()["score"]
+        
         # Generate improvement plan using AI
-        plan = ai_agents.generate_structured_response(
+        plan = self._generate(
+            "generate_improvement_plan",
             f"Generate a 6-month credit improvement plan for user {self.user_id}",
             system_prompt="You are a credit improvement expert. Generate a detailed 6-month plan with monthly goals and specific actions."
         )
@@ -194,8 +423,8 @@ class CreditManager:
         # If AI fails, use demo data
         if not plan:
             return {
-                "current_score": self.get_credit_score()["score"],
-                "target_score": min(self.get_credit_score()["score"] + 50, 850),
+                "current_score": score,
+                "target_score": min(score + 50, 850),
                 "timeframe": "6 months",
                 "monthly_goals": [
                     {
@@ -260,6 +489,10 @@ class CreditManager:
                     }
                 ]
             }
+        
+        # Fill in the headline scores if the AI plan left them out
+        plan.setdefault("current_score", score)
+        plan.setdefault("target_score", min(score + 50, 850))
             
         return plan
 
@@ -275,11 +508,17 @@ def credit_management_page(user_id: str):
     # Initialize credit manager
     credit_manager = CreditManager(user_id)
     
-    # Create tabs for different credit features
-    tabs = st.tabs(["Credit Score", "Credit Utilization", "Payment Optimization", "Improvement Plan"])
+    # Section selector; only the selected section's analysis is fetched
+    section = st.radio(
+        "Section",
+        ["Credit Score", "Credit Utilization", "Payment Optimization", "Improvement Plan"],
+        horizontal=True,
+        key="credit_section",
+        label_visibility="collapsed"
+    )
     
-    # Credit Score tab
-    with tabs[0]:
+    # Credit Score section
+    if section == "Credit Score":
         st.subheader("Credit Score Analysis")
         
         # Get credit score data
@@ -290,54 +529,20 @@ def credit_management_page(user_id: str):
         
         with col1:
             # Create a gauge chart for credit score
-            # Get score with default value
-            score = credit_data.get("score", 650)
-            category = credit_data.get("category", "Good")
-            color = credit_data.get("color", "yellow")
+            score, category, color = credit_data["score"], credit_data["category"], credit_data["color"]
             
-            fig = go.Figure(go.Indicator(
-                mode="gauge+number",
-                value=score,
-                domain={'x': [0, 1], 'y': [0, 1]},
-                title={'text': f"Credit Score: {category}"},
-                gauge={
-                    'axis': {'range': [300, 850], 'tickwidth': 1, 'tickcolor': "darkblue"},
-                    'bar': {'color': color},
-                    'bgcolor': "white",
-                    'borderwidth': 2,
-                    'bordercolor': "gray",
-                    'steps': [
-                        {'range': [300, 580], 'color': 'firebrick'},
-                        {'range': [580, 670], 'color': 'darkorange'},
-                        {'range': [670, 740], 'color': 'gold'},
-                        {'range': [740, 800], 'color': 'yellowgreen'},
-                        {'range': [800, 850], 'color': 'green'}
-                    ],
-                    'threshold': {
-                        'line': {'color': "darkblue", 'width': 4},
-                        'thickness': 0.75,
-                        'value': score
-                    }
-                }
-            ))
-            
-            fig.update_layout(
-                height=300,
-                margin=dict(l=20, r=20, t=50, b=20)
-            )
+            fig = _score_gauge(score, category, color)
             
             st.plotly_chart(fig, use_container_width=True)
             
             # Display factors affecting score
             st.subheader("Credit Score Factors")
             
+            factor_html = []
             for factor in credit_data["factors"]:
-                factor_color = "green" if factor["status"] == "Excellent" else \
-                              "lightgreen" if factor["status"] == "Very Good" else \
-                              "gold" if factor["status"] == "Good" else \
-                              "orange" if factor["status"] == "Fair" else "red"
-                              
-                st.markdown(f"""
+                factor_color = STATUS_COLOR.get(factor["status"], "red")
+                
+                factor_html.append(f"""
                 <div style="
                     background-color: rgba(0,0,0,0.05); 
                     padding: 10px; 
@@ -349,7 +554,10 @@ def credit_management_page(user_id: str):
                         <div style="width: {factor['score']}%; background-color: {factor_color}; height: 10px; border-radius: 5px;"></div>
                     </div>
                 </div>
-                """, unsafe_allow_html=True)
+                """)
+            
+            # Render all factors in one call
+            st.markdown("".join(factor_html), unsafe_allow_html=True)
         
         with col2:
             # Plot credit score history
@@ -358,19 +566,7 @@ def credit_management_page(user_id: str):
             history_df = pd.DataFrame(credit_data["history"])
             history_df["date"] = pd.to_datetime(history_df["date"])
             
-            fig = px.line(
-                history_df, 
-                x="date", 
-                y="score",
-                markers=True,
-                title="Score Trend Over Time"
-            )
-            
-            fig.update_layout(
-                xaxis_title="Date",
-                yaxis_title="Credit Score",
-                yaxis=dict(range=[min(history_df["score"]) - 20, 850])
-            )
+            fig = _score_history_chart(history_df)
             
             st.plotly_chart(fig, use_container_width=True)
             
@@ -380,8 +576,8 @@ def credit_management_page(user_id: str):
             for i, rec in enumerate(credit_data["recommendations"]):
                 st.markdown(f"**{i+1}.** {rec}")
     
-    # Credit Utilization tab
-    with tabs[1]:
+    # Credit Utilization section
+    elif section == "Credit Utilization":
         st.subheader("Credit Utilization Analysis")
         
         # Get utilization data
@@ -410,102 +606,59 @@ def credit_management_page(user_id: str):
         # Display individual accounts
         st.subheader("Account Breakdown")
         
+        account_df = pd.DataFrame(utilization_data["accounts"])
+        
+        # Add color based on utilization
+        account_df["color"] = np.select(
+            [account_df["utilization"] < 30, account_df["utilization"] < 50],
+            ["green", "orange"],
+            default="red"
+        )
+        
         col1, col2 = st.columns(2)
         
         with col1:
             # Bar chart of account utilization
-            account_df = pd.DataFrame(utilization_data["accounts"])
-            
-            # Add color based on utilization
-            account_df["color"] = account_df["utilization"].apply(
-                lambda x: "green" if x < 30 else "orange" if x < 50 else "red"
-            )
-            
-            fig = px.bar(
-                account_df,
-                x="name",
-                y="utilization",
-                color="color",
-                color_discrete_map={"green": "green", "orange": "orange", "red": "red"},
-                title="Utilization by Account",
-                labels={"name": "Account", "utilization": "Utilization (%)"},
-                text="utilization"
-            )
-            
-            fig.update_traces(
-                texttemplate="%{y:.1f}%", 
-                textposition="outside"
-            )
-            
-            fig.update_layout(
-                yaxis=dict(range=[0, max(account_df["utilization"]) * 1.2]),
-                showlegend=False
-            )
-            
-            # Add a horizontal line at 30%
-            fig.add_shape(
-                type="line",
-                x0=-0.5,
-                x1=len(account_df) - 0.5,
-                y0=30,
-                y1=30,
-                line=dict(color="green", width=2, dash="dash")
-            )
-            
-            fig.add_annotation(
-                x=len(account_df) - 1,
-                y=35,
-                text="Target: 30%",
-                showarrow=False,
-                font=dict(color="green")
-            )
+            fig = _utilization_bar_chart(account_df)
             
             st.plotly_chart(fig, use_container_width=True)
         
         with col2:
             # Pie chart of account balances
-            fig = px.pie(
-                account_df,
-                values="balance",
-                names="name",
-                title="Balance Distribution",
-                hole=0.4
-            )
-            
-            fig.update_traces(
-                textposition="inside",
-                textinfo="percent+label",
-                hovertemplate="%{label}: %{value:$,.2f} (%{percent})"
-            )
+            fig = _balance_pie_chart(account_df)
             
             st.plotly_chart(fig, use_container_width=True)
         
         # Account details table
         st.subheader("Account Details")
         
-        for account in utilization_data["accounts"]:
-            util_color = "green" if account["utilization"] < 30 else "orange" if account["utilization"] < 50 else "red"
+        account_html = []
+        for account in account_df.itertuples(index=False):
+            util_color = account.color
             
-            st.markdown(f"""
+            account_html.append(f"""
             <div style="
                 background-color: rgba(0,0,0,0.05); 
                 padding: 10px; 
                 border-radius: 5px; 
                 margin-bottom: 10px;
                 border-left: 5px solid {util_color};">
-                <b>{account["name"]}</b>
+                <b>{account.name}</b>
                 <table style="width: 100%; margin-top: 5px;">
                     <tr>
-                        <td style="width: 33%;">Balance: {format_currency(account["balance"])}</td>
-                        <td style="width: 33%;">Limit: {format_currency(account["limit"])}</td>
-                        <td style="width: 33%;">Utilization: <span style="color: {util_color}">{account["utilization"]:.1f}%</span></td>
+                        <td style="width: 33%;">Balance: {format_currency(account.balance)}</td>
+                        <td style="width: 33%;">Limit: {format_currency(account.limit)}</td>
+                        <td style="width: 33%;">Utilization: <span style="color: {util_color}">{account.utilization:.1f}%</span></td>
                     </tr>
                 </table>
                 <div style="margin-top: 5px; background-color: #eee; height: 10px; border-radius: 5px;">
-                    <div style="width: {min(account["utilization"], 100)}%; background-color: {util_color}; height: 10px; border-radius: 5px;"></div>
+                    <div style="width: {min(account.utilization, 100)}%; background-color: {util_color}; height: 10px; border-radius: 5px;"></div>
                 </div>
             </div>
-            """, unsafe_allow_html=True)
+            """)
+        
+        # Render all accounts in one call
+        st.markdown("".join(account_html), unsafe_allow_html=True)
         
         # Recommendations
         st.subheader("Optimization Recommendations")
@@ -513,30 +666,30 @@ def credit_management_page(user_id: str):
         for i, rec in enumerate(utilization_data["recommendations"]):
             st.markdown(f"**{i+1}.** {rec}")
     
-    # Payment Optimization tab
-    with tabs[2]:
+    # Payment Optimization section
+    elif section == "Payment Optimization":
         st.subheader("Payment Optimization")
         
         # Get payment recommendations
         payment_recs = credit_manager.get_payment_recommendations()
         
-        # Sort by impact and due date
-        payment_recs = sorted(payment_recs, key=lambda x: (
-            0 if x["impact"] == "High" else 1 if x["impact"] == "Medium" else 2,
-            datetime.datetime.strptime(x["due_date"], "%Y-%m-%d")
-        ))
-        
+        # Sort by impact and due date, parsing the dates once
+        recs_df = pd.DataFrame(payment_recs)
+        recs_df["due"] = pd.to_datetime(recs_df["due_date"], format="%Y-%m-%d")
+        recs_df["impact_rank"] = recs_df["impact"].map(IMPACT_RANK).fillna(len(IMPACT_RANK))
+        recs_df = recs_df.sort_values(["impact_rank", "due"], kind="stable")
+        recs_df["days_until"] = (recs_df["due"] - pd.Timestamp.now()).dt.days
         # Display upcoming payments
         st.markdown("### Upcoming Payments")
         
-        for rec in payment_recs:
-            impact_color = "red" if rec["impact"] == "High" else "orange" if rec["impact"] == "Medium" else "blue"
+        payment_html = []
+        for rec in recs_df.itertuples(index=False):
+            impact_color = "red" if rec.impact == "High" else "orange" if rec.impact == "Medium" else "blue"
             
-            # Calculate days until due
-            due_date = datetime.datetime.strptime(rec["due_date"], "%Y-%m-%d")
-            days_until = (due_date - datetime.datetime.now()).days
+            # Days until due
+            days_until = rec.days_until
             
-            st.markdown(f"""
+            payment_html.append(f"""
             <div style="
                 background-color: rgba(0,0,0,0.05); 
                 padding: 15px; 
@@ -544,86 +697,51 @@ def credit_management_page(user_id: str):
                 margin-bottom: 15px;
                 border-left: 5px solid {impact_color};">
                 <div style="display: flex; justify-content: space-between; align-items: center;">
-                    <h4 style="margin: 0;">{rec["account"]}</h4>
-                    <span style="background-color: {impact_color}; color: white; padding: 3px 8px; border-radius: 10px; font-size: 0.8em;">{rec["impact"]} Impact</span>
+                    <h4 style="margin: 0;">{rec.account}</h4>
+                    <span style="background-color: {impact_color}; color: white; padding: 3px 8px; border-radius: 10px; font-size: 0.8em;">{rec.impact} Impact</span>
                 </div>
                 <div style="margin-top: 10px;">
-                    <p><b>Due Date:</b> {rec["due_date"]} ({days_until} days from now)</p>
-                    <p><b>Current Balance:</b> {format_currency(rec["current_balance"])}</p>
+                    <p><b>Due Date:</b> {rec.due_date} ({days_until} days from now)</p>
+                    <p><b>Current Balance:</b> {format_currency(rec.current_balance)}</p>
                     <table style="width: 100%; border-collapse: collapse; margin-top: 10px;">
                         <tr>
                             <td style="padding: 8px; border: 1px solid #ddd; width: 50%;">
-                                <b>Minimum Payment:</b> {format_currency(rec["min_payment"])}
+                                <b>Minimum Payment:</b> {format_currency(rec.min_payment)}
                             </td>
                             <td style="padding: 8px; border: 1px solid #ddd; width: 50%; background-color: rgba(0,255,0,0.05);">
-                                <b>Recommended Payment:</b> {format_currency(rec["optimal_payment"])}
+                                <b>Recommended Payment:</b> {format_currency(rec.optimal_payment)}
                             </td>
                         </tr>
                     </table>
-                    <p style="margin-top: 10px;"><b>Recommendation:</b> {rec["recommendation"]}</p>
+                    <p style="margin-top: 10px;"><b>Recommendation:</b> {rec.recommendation}</p>
                 </div>
             </div>
-            """, unsafe_allow_html=True)
+            """)
+        
+        # Render all upcoming payments in one call
+        st.markdown("".join(payment_html), unsafe_allow_html=True)
         
         # Payment calendar visualization
         st.subheader("Payment Calendar")
         
-        # Create dataframe for visualization
-        payment_df = pd.DataFrame([
-            {
-                "Account": rec["account"],
-                "Date": rec["due_date"],
-                "Amount": rec["optimal_payment"],
-                "Type": "Optimal Payment",
-                "Impact": rec["impact"]
-            } for rec in payment_recs
-        ])
-        
-        # Add minimum payments for comparison
-        payment_df = pd.concat([
-            payment_df,
-            pd.DataFrame([
-                {
-                    "Account": rec["account"],
-                    "Date": rec["due_date"],
-                    "Amount": rec["min_payment"],
-                    "Type": "Minimum Payment",
-                    "Impact": rec["impact"]
-                } for rec in payment_recs
-            ])
-        ])
-        
-        # Convert date to datetime
-        payment_df["Date"] = pd.to_datetime(payment_df["Date"])
+        # Stack optimal and minimum payments into one long frame for comparison
+        payment_df = recs_df.melt(
+            id_vars=["account", "due", "impact"],
+            value_vars=["optimal_payment", "min_payment"],
+            var_name="Type",
+            value_name="Amount"
+        ).rename(columns={"account": "Account", "due": "Date", "impact": "Impact"})
+        payment_df["Type"] = payment_df["Type"].map(PAYMENT_TYPE_LABELS)
         
         # Create grouped bar chart
-        fig = px.bar(
-            payment_df,
-            x="Date",
-            y="Amount",
-            color="Type",
-            barmode="group",
-            title="Payment Schedule",
-            color_discrete_map={
-                "Optimal Payment": "green",
-                "Minimum Payment": "lightgray"
-            },
-            hover_data=["Account", "Impact"]
-        )
-        
-        fig.update_layout(
-            xaxis_title="Date",
-            yaxis_title="Payment Amount ($)",
-            legend_title="Payment Type"
-        )
+        fig = _payment_schedule_chart(payment_df)
         
         st.plotly_chart(fig, use_container_width=True)
         
         # Payment strategy summary
         st.subheader("Payment Strategy Summary")
         
-        total_min = sum(rec["min_payment"] for rec in payment_recs)
-        total_optimal = sum(rec["optimal_payment"] for rec in payment_recs)
+        total_min, total_optimal = recs_df[["min_payment", "optimal_payment"]].sum()
         
         col1, col2, col3 = st.columns(3)
         
@@ -675,8 +793,8 @@ def credit_management_page(user_id: str):
             </div>
             """, unsafe_allow_html=True)
     
-    # Improvement Plan tab
-    with tabs[3]:
+    # Improvement Plan section
+    elif section == "Improvement Plan":
         st.subheader("Credit Improvement Plan")
         
         # Get improvement plan
@@ -708,36 +826,8 @@ def credit_management_page(user_id: str):
         # Monthly goals
         st.subheader("Monthly Goals and Actions")
         
-        # Create tabs for each month
-        month_tabs = st.tabs([goal["month"] for goal in plan["monthly_goals"]])
+        # Render every month in one table, with each month's actions joined into one cell
+        goals_df = pd.DataFrame(plan["monthly_goals"]).assign(actions=lambda d: d["actions"].str.join(" • "))
+        goals_df = goals_df.rename(columns=str.title).set_index("Month")
         
-        # Fill each month's tab
-        for i, month_tab in enumerate(month_tabs):
-            goal = plan["monthly_goals"][i]
-            
-            with month_tab:
-                st.markdown(f"""
-                <div style="
-                    background-color: rgba(79, 139, 249, 0.1); 
-                    padding: 15px; 
-                    border-radius: 5px; 
-                    margin-bottom: 15px;
-                    border-left: 5px solid #4F8BF9;">
-                    <h3>{goal["month"]}: {goal["focus"]}</h3>
-                    <p><b>Target:</b> {goal["target"]}</p>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                st.subheader("Action Plan")
-                
-                for j, action in enumerate(goal["actions"]):
-                    st.markdown(f"""
-                    <div style="
-                        background-color: rgba(0,0,0,0.02); 
-                        padding: 10px; 
-                        border-radius: 5px; 
-                        margin-bottom: 10px;
-                        border-left: 3px solid #4F8BF9;">
-                        <p><b>Action {j+1}:</b> {action}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
\ No newline at end of file
+        st.table(goals_df)
\ No newline at end of file
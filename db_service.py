@@ -1,7 +1,16 @@
 import os
+import copy
 import hashlib
+import hmac
 import datetime
+import uuid
+import functools
+import threading
 from typing import List, Dict, Optional, Any
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from cachetools import TTLCache
+from sqlalchemy import Index, and_, case, func, insert, inspect, lambda_stmt, select
 from sqlalchemy.orm import Session
 import json
 
@@ -14,19 +23,96 @@ from db_models import (
     FinancialAnalysis,
     UserSetting,
     get_db,
-    init_db
+    init_db as create_tables
 )
 
+# Composite indexes covering the service's hot filter and ordering patterns
+HOT_PATH_INDEXES = (
+    Index("ix_txn_user_type_date", Transaction.user_id, Transaction.type, Transaction.date),
+    Index("ix_goal_user", Goal.user_id),
+    Index("ix_budget_user", Budget.user_id),
+    Index("ix_fa_user_type_created", FinancialAnalysis.user_id, FinancialAnalysis.analysis_type, FinancialAnalysis.created_at),
+    Index("ix_txn_user_year_month", Transaction.user_id, func.substr(Transaction.date, 1, 7))
+)
+
+def ensure_indexes():
+    """Create any missing hot-path indexes on the existing tables."""
+    db = get_db()
+    try:
+        bind = db.get_bind()
+        for index in HOT_PATH_INDEXES:
+            index.create(bind, checkfirst=True)
+    finally:
+        db.close()
+
 # Initialize the database on import
 def init_db():
     """Initialize the database on import."""
     try:
-        init_db()
+        create_tables()
+        ensure_indexes()
     except Exception as e:
         print(f"Database initialization error: {str(e)}")
         # Continue without failing to allow basic functionality
         pass
 
+# Argon2id password hashing, tuned to roughly 50ms per hash
+_password_hasher = PasswordHasher(time_cost=2, memory_cost=64 * 1024, parallelism=1)
+
+# Short-lived per-user cache for reference reads that change rarely (settings, budgets, goals)
+REFERENCE_CACHE_TTL = 60
+_reference_cache = TTLCache(maxsize=1024, ttl=REFERENCE_CACHE_TTL)
+_reference_cache_lock = threading.RLock()
+
+def _snapshot(obj):
+    """Capture a loaded ORM object as its class and a dict of column values."""
+    mapper = inspect(obj).mapper
+    return type(obj), {attr.key: getattr(obj, attr.key) for attr in mapper.column_attrs}
+
+def _restore(snapshot):
+    """Build a fresh object from a snapshot so callers never share cached state."""
+    cls, values = snapshot
+    return cls(**copy.deepcopy(values))
+
+def _cached_per_user(entity: str):
+    """Cache a single-argument user read under (entity, user_id) for REFERENCE_CACHE_TTL seconds.
+
+    The cache holds column snapshots rather than ORM objects, and every call gets
+    newly built objects, so a caller mutating its result cannot corrupt the cache.
+    """
+    def decorator(read):
+        @functools.wraps(read)
+        def wrapper(user_id: str):
+            key = (entity, user_id)
+            with _reference_cache_lock:
+                cached = _reference_cache.get(key)
+
+            if cached is None:
+                value = read(user_id)
+                if value is None:
+                    cached = (None,)
+                elif isinstance(value, list):
+                    cached = ([_snapshot(obj) for obj in value],)
+                else:
+                    cached = (_snapshot(value),)
+
+                with _reference_cache_lock:
+                    _reference_cache[key] = cached
+
+            value = cached[0]
+            if value is None:
+                return None
+            if isinstance(value, list):
+                return [_restore(snapshot) for snapshot in value]
+            return _restore(value)
+        return wrapper
+    return decorator
+
+def invalidate_user_cache(entity: str, user_id: str):
+    """Drop a user's cached reference read ("settings", "budgets" or "goals") after a write."""
+    with _reference_cache_lock:
+        _reference_cache.pop((entity, user_id), None)
+
 # User operations
 def get_user_by_email(email: str) -> Optional[User]:
     """Get a user by email."""
@@ -48,11 +134,11 @@ def create_user(email: str, password: str, name: str) -> User:
     """Create a new user."""
     db = get_db()
     try:
-        # Generate user ID from email
-        user_id = hashlib.md5(email.encode()).hexdigest()
+        # Generate a random user ID; email stays the unique lookup key
+        user_id = uuid.uuid4().hex
 
         # Hash password
-        password_hash = hashlib.sha256(password.encode()).hexdigest()
+        password_hash = _password_hasher.hash(password)
 
         # Create user
         user = User(
@@ -70,22 +156,113 @@ def create_user(email: str, password: str, name: str) -> User:
         settings = UserSetting(user_id=user_id)
         db.add(settings)
         db.commit()
+        invalidate_user_cache("settings", user_id)
 
         return user
     finally:
         db.close()
 
-def verify_password(stored_hash: str, password: str) -> bool:
-    """Verify a password against a hash."""
-    password_hash = hashlib.sha256(password.encode()).hexdigest()
-    return stored_hash == password_hash
+def _upgrade_password_hash(stored_hash: str, password: str, user_id: str = None):
+    """Replace stored_hash with a fresh Argon2 hash for its owner, or for every user sharing it."""
+    db = get_db()
+    try:
+        # Matching on the old hash as well skips rows changed since the check
+        query = db.query(User).filter(User.password_hash == stored_hash)
+        if user_id:
+            query = query.filter(User.id == user_id)
+
+        # Legacy hashes are unsalted, so users with the same password share one; salt each separately
+        for user in query.all():
+            user.password_hash = _password_hasher.hash(password)
+        db.commit()
+    finally:
+        db.close()
+
+def verify_password(stored_hash: str, password: str, user_id: str = None) -> bool:
+    """
+    Verify a password against a hash.
+
+    Legacy unsalted SHA-256 hashes are still accepted. A successful check upgrades
+    a legacy or outdated hash to the current Argon2 settings. The owner is looked
+    up by the stored hash when user_id is not given.
+
+    Args:
+        stored_hash: The stored password hash
+        password: The password to check
+        user_id: Owner of the hash, if known
+
+    Returns:
+        bool: Whether the password matches
+    """
+    if not stored_hash:
+        return False
+
+    if stored_hash.startswith("$argon2"):
+        try:
+            _password_hasher.verify(stored_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+        needs_rehash = _password_hasher.check_needs_rehash(stored_hash)
+    else:
+        password_hash = hashlib.sha256(password.encode()).hexdigest()
+        if not hmac.compare_digest(stored_hash, password_hash):
+            return False
+        needs_rehash = True
+
+    if needs_rehash:
+        try:
+            _upgrade_password_hash(stored_hash, password, user_id)
+        except Exception as e:
+            print(f"Error upgrading password hash: {str(e)}")
+
+    return True
 
 # Transaction operations
 def get_transactions(user_id: str) -> List[Transaction]:
     """Get all transactions for a user."""
     db = get_db()
     try:
-        return db.query(Transaction).filter(Transaction.user_id == user_id).all()
+        stmt = lambda_stmt(lambda: select(Transaction))
+        stmt += lambda s: s.where(Transaction.user_id == user_id)
+        return db.execute(stmt).scalars().all()
+    finally:
+        db.close()
+
+# Rows fetched per round trip when streaming large result sets
+STREAM_BATCH_SIZE = 1000
+
+def iter_transaction_dicts(user_id: str):
+    """Stream a user's transactions as dictionaries, hydrating at most one batch of ORM objects at a time."""
+    db = get_db()
+    try:
+        query = db.query(Transaction).filter(Transaction.user_id == user_id)
+        for transaction in query.yield_per(STREAM_BATCH_SIZE):
+            yield transaction.to_dict()
+    finally:
+        db.close()
+
+def get_transaction_rows(user_id: str, start_date: str = None) -> List[Any]:
+    """Get (date, type, amount) rows for a user's transactions without ORM hydration."""
+    db = get_db()
+    try:
+        stmt = select(Transaction.date, Transaction.type, Transaction.amount).where(
+            Transaction.user_id == user_id
+        )
+
+        if start_date:
+            stmt = stmt.where(Transaction.date >= start_date)
+
+        return db.execute(stmt).all()
+    finally:
+        db.close()
+
+def get_recent_transactions(user_id: str, limit: int = 50) -> List[Transaction]:
+    """Get a user's most recent transactions, newest first."""
+    db = get_db()
+    try:
+        return db.query(Transaction).filter(
+            Transaction.user_id == user_id
+        ).order_by(Transaction.date.desc()).limit(limit).all()
     finally:
         db.close()
 
@@ -112,6 +289,38 @@ def create_transaction(user_id: str, transaction_data: Dict[str, Any]) -> Transa
     finally:
         db.close()
 
+# Rows inserted per statement when bulk-creating transactions
+BULK_INSERT_BATCH_SIZE = 1000
+
+def bulk_create_transactions(user_id: str, rows: List[Dict[str, Any]]) -> int:
+    """Create many transactions with batched multi-row inserts."""
+    if not rows:
+        return 0
+
+    payload = [
+        {
+            "user_id": user_id,
+            "date": row.get("date"),
+            "description": row.get("description"),
+            "amount": row.get("amount"),
+            "type": row.get("type"),
+            "category": row.get("category"),
+            "notes": row.get("notes")
+        }
+        for row in rows
+    ]
+
+    db = get_db()
+    try:
+        for start in range(0, len(payload), BULK_INSERT_BATCH_SIZE):
+            db.execute(insert(Transaction), payload[start:start + BULK_INSERT_BATCH_SIZE])
+
+        db.commit()
+
+        return len(payload)
+    finally:
+        db.close()
+
 def update_transaction(transaction_id: int, transaction_data: Dict[str, Any]) -> Optional[Transaction]:
     """Update a transaction."""
     db = get_db()
@@ -150,11 +359,14 @@ def delete_transaction(transaction_id: int) -> bool:
         db.close()
 
 # Goal operations
+@_cached_per_user("goals")
 def get_goals(user_id: str) -> List[Goal]:
     """Get all goals for a user."""
     db = get_db()
     try:
-        return db.query(Goal).filter(Goal.user_id == user_id).all()
+        stmt = lambda_stmt(lambda: select(Goal))
+        stmt += lambda s: s.where(Goal.user_id == user_id)
+        return db.execute(stmt).scalars().all()
     finally:
         db.close()
 
@@ -176,6 +388,7 @@ def create_goal(user_id: str, goal_data: Dict[str, Any]) -> Goal:
         db.add(goal)
         db.commit()
         db.refresh(goal)
+        invalidate_user_cache("goals", user_id)
 
         return goal
     finally:
@@ -197,11 +410,37 @@ def update_goal(goal_id: int, goal_data: Dict[str, Any]) -> Optional[Goal]:
 
         db.commit()
         db.refresh(goal)
+        invalidate_user_cache("goals", goal.user_id)
 
         return goal
     finally:
         db.close()
 
+def update_goals_bulk(goal_updates: Dict[int, Dict[str, Any]]) -> int:
+    """Update several goals in a single transaction."""
+    if not goal_updates:
+        return 0
+
+    db = get_db()
+    try:
+        goals = db.query(Goal).filter(Goal.id.in_(list(goal_updates.keys()))).all()
+
+        # Update fields
+        for goal in goals:
+            for key, value in goal_updates[goal.id].items():
+                if hasattr(goal, key):
+                    setattr(goal, key, value)
+
+        user_ids = {goal.user_id for goal in goals}
+        db.commit()
+
+        for user_id in user_ids:
+            invalidate_user_cache("goals", user_id)
+
+        return len(goals)
+    finally:
+        db.close()
+
 def delete_goal(goal_id: int) -> bool:
     """Delete a goal."""
     db = get_db()
@@ -211,19 +450,24 @@ def delete_goal(goal_id: int) -> bool:
         if not goal:
             return False
 
+        user_id = goal.user_id
         db.delete(goal)
         db.commit()
+        invalidate_user_cache("goals", user_id)
 
         return True
     finally:
         db.close()
 
 # Budget operations
+@_cached_per_user("budgets")
 def get_budgets(user_id: str) -> List[Budget]:
     """Get all budgets for a user."""
     db = get_db()
     try:
-        return db.query(Budget).filter(Budget.user_id == user_id).all()
+        stmt = lambda_stmt(lambda: select(Budget))
+        stmt += lambda s: s.where(Budget.user_id == user_id)
+        return db.execute(stmt).scalars().all()
     finally:
         db.close()
 
@@ -243,6 +487,7 @@ def create_budget(user_id: str, budget_data: Dict[str, Any]) -> Budget:
         db.add(budget)
         db.commit()
         db.refresh(budget)
+        invalidate_user_cache("budgets", user_id)
 
         return budget
     finally:
@@ -264,6 +509,7 @@ def update_budget(budget_id: int, budget_data: Dict[str, Any]) -> Optional[Budge
 
         db.commit()
         db.refresh(budget)
+        invalidate_user_cache("budgets", budget.user_id)
 
         return budget
     finally:
@@ -278,8 +524,10 @@ def delete_budget(budget_id: int) -> bool:
         if not budget:
             return False
 
+        user_id = budget.user_id
         db.delete(budget)
         db.commit()
+        invalidate_user_cache("budgets", user_id)
 
         return True
     finally:
@@ -310,21 +558,26 @@ def get_financial_analyses(user_id: str, analysis_type: str = None) -> List[Fina
     """Get financial analyses for a user."""
     db = get_db()
     try:
-        query = db.query(FinancialAnalysis).filter(FinancialAnalysis.user_id == user_id)
+        stmt = lambda_stmt(lambda: select(FinancialAnalysis))
+        stmt += lambda s: s.where(FinancialAnalysis.user_id == user_id)
 
         if analysis_type:
-            query = query.filter(FinancialAnalysis.analysis_type == analysis_type)
+            stmt += lambda s: s.where(FinancialAnalysis.analysis_type == analysis_type)
 
-        return query.order_by(FinancialAnalysis.created_at.desc()).all()
+        stmt += lambda s: s.order_by(FinancialAnalysis.created_at.desc())
+        return db.execute(stmt).scalars().all()
     finally:
         db.close()
 
 # User settings operations
+@_cached_per_user("settings")
 def get_user_settings(user_id: str) -> Optional[UserSetting]:
     """Get user settings."""
     db = get_db()
     try:
-        return db.query(UserSetting).filter(UserSetting.user_id == user_id).first()
+        stmt = lambda_stmt(lambda: select(UserSetting))
+        stmt += lambda s: s.where(UserSetting.user_id == user_id)
+        return db.execute(stmt).scalars().first()
     finally:
         db.close()
 
@@ -346,17 +599,28 @@ def update_user_settings(user_id: str, settings_data: Dict[str, Any]) -> Optiona
 
         db.commit()
         db.refresh(settings)
+        invalidate_user_cache("settings", user_id)
 
         return settings
     finally:
         db.close()
 
 # Helper functions for analytics
+def _current_month_filter():
+    """Match this month's transactions with an index-friendly date range instead of LIKE."""
+    today = datetime.date.today()
+    month_start = today.replace(day=1)
+    next_month_start = (month_start + datetime.timedelta(days=32)).replace(day=1)
+    return and_(
+        Transaction.date >= month_start.strftime("%Y-%m-%d"),
+        Transaction.date < next_month_start.strftime("%Y-%m-%d")
+    )
+
 def get_category_spending(user_id: str, start_date: str = None, end_date: str = None) -> Dict[str, float]:
     """Get spending by category."""
     db = get_db()
     try:
-        query = db.query(Transaction).filter(
+        query = db.query(Transaction.category, func.sum(Transaction.amount)).filter(
             Transaction.user_id == user_id,
             Transaction.type == "expense"
         )
@@ -367,20 +631,8 @@ def get_category_spending(user_id: str, start_date: str = None, end_date: str =
         if end_date:
             query = query.filter(Transaction.date <= end_date)
 
-        transactions = query.all()
-
-        # Group by category
-        category_spending = {}
-        for transaction in transactions:
-            category = transaction.category
-            amount = transaction.amount
-
-            if category not in category_spending:
-                category_spending[category] = 0
-
-            category_spending[category] += amount
-
-        return category_spending
+        # Group by category in the database
+        return {category: amount for category, amount in query.group_by(Transaction.category).all()}
     finally:
         db.close()
 
@@ -388,7 +640,7 @@ def get_daily_spending(user_id: str, start_date: str = None, end_date: str = Non
     """Get daily spending."""
     db = get_db()
     try:
-        query = db.query(Transaction).filter(
+        query = db.query(Transaction.date, func.sum(Transaction.amount)).filter(
             Transaction.user_id == user_id,
             Transaction.type == "expense"
         )
@@ -399,20 +651,30 @@ def get_daily_spending(user_id: str, start_date: str = None, end_date: str = Non
         if end_date:
             query = query.filter(Transaction.date <= end_date)
 
-        transactions = query.all()
+        # Group by date in the database
+        return {date: amount for date, amount in query.group_by(Transaction.date).all()}
+    finally:
+        db.close()
 
-        # Group by date
-        daily_spending = {}
-        for transaction in transactions:
-            date = transaction.date
-            amount = transaction.amount
+def get_income_expense_totals(user_id: str, start_date: str = None, end_date: str = None) -> Dict[str, float]:
+    """Get total income and expenses."""
+    db = get_db()
+    try:
+        query = db.query(Transaction.type, func.sum(Transaction.amount)).filter(
+            Transaction.user_id == user_id
+        )
+
+        if start_date:
+            query = query.filter(Transaction.date >= start_date)
 
-            if date not in daily_spending:
-                daily_spending[date] = 0
+        if end_date:
+            query = query.filter(Transaction.date <= end_date)
 
-            daily_spending[date] += amount
+        totals = {"income": 0, "expense": 0}
+        for txn_type, amount in query.group_by(Transaction.type).all():
+            totals[txn_type] = amount or 0
 
-        return daily_spending
+        return totals
     finally:
         db.close()
 
@@ -420,29 +682,22 @@ def get_monthly_spending(user_id: str, year: int = None) -> Dict[str, float]:
     """Get monthly spending."""
     db = get_db()
     try:
-        query = db.query(Transaction).filter(
+        # Extract year and month (YYYY-MM)
+        month = func.substr(Transaction.date, 1, 7)
+
+        query = db.query(month, func.sum(Transaction.amount)).filter(
             Transaction.user_id == user_id,
             Transaction.type == "expense"
         )
 
         if year:
-            query = query.filter(Transaction.date.like(f"{year}-%"))
-
-        transactions = query.all()
-
-        # Group by month
-        monthly_spending = {}
-        for transaction in transactions:
-            # Extract year and month (YYYY-MM)
-            month = transaction.date[:7]
-            amount = transaction.amount
+            query = query.filter(
+                Transaction.date >= f"{year}-01-01",
+                Transaction.date < f"{year + 1}-01-01"
+            )
 
-            if month not in monthly_spending:
-                monthly_spending[month] = 0
-
-            monthly_spending[month] += amount
-
-        return monthly_spending
+        # Group by month in the database
+        return {month_key: amount for month_key, amount in query.group_by(month).all()}
     finally:
         db.close()
 
@@ -450,59 +705,36 @@ def calculate_balance(user_id: str) -> float:
     """Calculate the current balance."""
     db = get_db()
     try:
-        # Get income
-        income_query = db.query(Transaction).filter(
-            Transaction.user_id == user_id,
-            Transaction.type == "income"
-        )
-
-        total_income = sum(transaction.amount for transaction in income_query.all())
-
-        # Get expenses
-        expense_query = db.query(Transaction).filter(
-            Transaction.user_id == user_id,
-            Transaction.type == "expense"
-        )
-
-        total_expenses = sum(transaction.amount for transaction in expense_query.all())
+        # Sum income and expenses in one grouped query
+        totals = dict(db.query(Transaction.type, func.sum(Transaction.amount)).filter(
+            Transaction.user_id == user_id
+        ).group_by(Transaction.type).all())
 
         # Calculate balance
-        return total_income - total_expenses
+        return (totals.get("income") or 0) - (totals.get("expense") or 0)
     finally:
         db.close()
 
-def check_budget_status(user_id: str) -> List[Dict[str, Any]]:
-    """Check budget status and return warnings."""
-    db = get_db()
-    try:
-        # Get budgets
-        budgets = db.query(Budget).filter(Budget.user_id == user_id).all()
+def check_budget_status(user_id: str, budgets: Optional[List[Budget]] = None) -> List[Dict[str, Any]]:
+    """Check budget status and return warnings, reusing already-loaded budgets if given."""
+    # Get budgets, served from the per-user reference cache when warm
+    if budgets is None:
+        budgets = get_budgets(user_id)
 
-        # Get current month
-        current_month = datetime.datetime.now().strftime("%Y-%m")
+    # Nothing to check without budgets
+    if not budgets:
+        return []
 
-        # Get monthly spending by category
-        query = db.query(Transaction).filter(
+    db = get_db()
+    try:
+        # Sum this month's spending by category in the database
+        category_spending = dict(db.query(Transaction.category, func.sum(Transaction.amount)).filter(
             Transaction.user_id == user_id,
             Transaction.type == "expense",
-            Transaction.date.like(f"{current_month}%")
-        )
-
-        transactions = query.all()
-
-        # Calculate spending by category
-        category_spending = {}
-        total_spending = 0
-
-        for transaction in transactions:
-            category = transaction.category
-            amount = transaction.amount
+            _current_month_filter()
+        ).group_by(Transaction.category).all())
 
-            if category not in category_spending:
-                category_spending[category] = 0
-
-            category_spending[category] += amount
-            total_spending += amount
+        total_spending = sum(category_spending.values())
 
         # Check budgets
         warnings = []
@@ -545,6 +777,9 @@ def check_budget_status(user_id: str) -> List[Dict[str, Any]]:
     finally:
         db.close()
 
+# Rows deleted per committed batch when resetting a user's transactions
+RESET_BATCH_SIZE = 1000
+
 def reset_user_data(user_id: str) -> bool:
     """
     Reset all user data - delete all transactions, goals, budgets, and analyses.
@@ -557,54 +792,43 @@ def reset_user_data(user_id: str) -> bool:
     """
     db = get_db()
     try:
-        # Start a transaction
-        db.begin()
-
-        # Delete all vector transactions for user's transactions
-        vector_txns = db.query(VectorTransaction).join(
-            Transaction, 
-            Transaction.id == VectorTransaction.transaction_id
-        ).filter(
-            Transaction.user_id == user_id
-        ).all()
-
-        for vtxn in vector_txns:
-            db.delete(vtxn)
-
         # Delete all financial analyses
-        analyses = db.query(FinancialAnalysis).filter(
+        db.query(FinancialAnalysis).filter(
             FinancialAnalysis.user_id == user_id
-        ).all()
-
-        for analysis in analyses:
-            db.delete(analysis)
-
-        # Delete all transactions
-        transactions = db.query(Transaction).filter(
-            Transaction.user_id == user_id
-        ).all()
-
-        for txn in transactions:
-            db.delete(txn)
+        ).delete(synchronize_session=False)
+
+        # Delete transactions and their vector rows in batches, committing each
+        # batch so a large history never holds one huge DB transaction
+        while True:
+            batch_ids = [row.id for row in db.query(Transaction.id).filter(
+                Transaction.user_id == user_id
+            ).limit(RESET_BATCH_SIZE)]
+
+            if not batch_ids:
+                break
+
+            db.query(VectorTransaction).filter(
+                VectorTransaction.transaction_id.in_(batch_ids)
+            ).delete(synchronize_session=False)
+            db.query(Transaction).filter(
+                Transaction.id.in_(batch_ids)
+            ).delete(synchronize_session=False)
+            db.commit()
 
         # Delete all goals
-        goals = db.query(Goal).filter(
+        db.query(Goal).filter(
             Goal.user_id == user_id
-        ).all()
-
-        for goal in goals:
-            db.delete(goal)
+        ).delete(synchronize_session=False)
 
         # Delete all budgets
-        budgets = db.query(Budget).filter(
+        db.query(Budget).filter(
             Budget.user_id == user_id
-        ).all()
-
-        for budget in budgets:
-            db.delete(budget)
+        ).delete(synchronize_session=False)
 
         # Commit changes
         db.commit()
+        invalidate_user_cache("goals", user_id)
+        invalidate_user_cache("budgets", user_id)
         return True
 
     except Exception as e:
@@ -615,48 +839,36 @@ def reset_user_data(user_id: str) -> bool:
     finally:
         db.close()
 
+def _sum_amount_where(condition):
+    """Sum transaction amounts matching a condition, treating no rows as 0."""
+    return func.coalesce(func.sum(case((condition, Transaction.amount), else_=0)), 0)
+
 def get_transaction_summary(user_id: str) -> Dict[str, Any]:
     """Get transaction summary for a user."""
     db = get_db()
     try:
-        # Get total transactions
-        total_transactions = db.query(Transaction).filter(Transaction.user_id == user_id).count()
-
-        # Get total income and expenses
-        income_query = db.query(Transaction).filter(
-            Transaction.user_id == user_id,
-            Transaction.type == "income"
-        )
-
-        expense_query = db.query(Transaction).filter(
-            Transaction.user_id == user_id,
-            Transaction.type == "expense"
-        )
-
-        total_income = sum(transaction.amount for transaction in income_query.all())
-        total_expenses = sum(transaction.amount for transaction in expense_query.all())
+        is_income = Transaction.type == "income"
+        is_expense = Transaction.type == "expense"
+        in_month = _current_month_filter()
+
+        # Count and sum totals plus current-month totals in a single scan
+        (
+            total_transactions,
+            total_income,
+            total_expenses,
+            monthly_income,
+            monthly_expenses
+        ) = db.query(
+            func.count(Transaction.id),
+            _sum_amount_where(is_income),
+            _sum_amount_where(is_expense),
+            _sum_amount_where(and_(is_income, in_month)),
+            _sum_amount_where(and_(is_expense, in_month))
+        ).filter(Transaction.user_id == user_id).one()
 
         # Calculate balance
         balance = total_income - total_expenses
 
-        # Get monthly income and expenses
-        current_month = datetime.datetime.now().strftime("%Y-%m")
-
-        monthly_income_query = db.query(Transaction).filter(
-            Transaction.user_id == user_id,
-            Transaction.type == "income",
-            Transaction.date.like(f"{current_month}%")
-        )
-
-        monthly_expense_query = db.query(Transaction).filter(
-            Transaction.user_id == user_id,
-            Transaction.type == "expense",
-            Transaction.date.like(f"{current_month}%")
-        )
-
-        monthly_income = sum(transaction.amount for transaction in monthly_income_query.all())
-        monthly_expenses = sum(transaction.amount for transaction in monthly_expense_query.all())
-
         # Calculate savings rate
         savings_rate = 0
         if monthly_income > 0:
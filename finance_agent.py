@@ -1,8 +1,11 @@
 import os
 import json
+import copy
 import datetime
+import heapq
 from typing import List, Dict, Any, Optional, Tuple
 import random
+import numpy as np
 import streamlit as st
 import openai
 
@@ -10,6 +13,9 @@ import openai
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
 HAS_API_KEY = bool(OPENAI_API_KEY)
 
+# Query embedding settings
+EMBEDDING_MODEL = "text-embedding-3-small"
+
 # Import AI functionality
 import ai_agents
 import vector_processing as vp
@@ -20,6 +26,22 @@ from utils import get_date_range, get_recommendations
 # Import quantitative finance module
 import quant_finance as qf
 
+def _recurrence_stats(dates: np.ndarray, amounts: np.ndarray) -> Tuple[float, float]:
+    """
+    Compute the average amount and average interval of a recurring transaction.
+
+    Args:
+        dates: Sorted transaction dates as datetime64[D]
+        amounts: Transaction amounts
+
+    Returns:
+        Tuple of (average amount, average days between transactions)
+    """
+    avg_amount = float(amounts.mean()) if amounts.size else 0.0
+    if dates.size < 2:
+        return avg_amount, float("nan")
+    return avg_amount, float(np.diff(dates).astype(np.int64).mean())
+
 class FinanceAgent:
     """
     Finance Agent class for AI-powered financial analysis and insights.
@@ -47,6 +69,22 @@ class FinanceAgent:
         """Set the user ID."""
         self.user_id = user_id
 
+    def for_user(self, user_id: str) -> "FinanceAgent":
+        """
+        Return a copy of this agent bound to a user, sharing the OpenAI client.
+
+        Use this instead of set_user on an agent shared between sessions or threads.
+
+        Args:
+            user_id: The user ID
+
+        Returns:
+            Agent bound to the user
+        """
+        agent = copy.copy(self)
+        agent.user_id = user_id
+        return agent
+
     async def analyze_transaction(self, transaction_id: int) -> Dict[str, Any]:
         """
         Analyze a single transaction for insights.
@@ -142,6 +180,26 @@ class FinanceAgent:
                 "answer": "I'm sorry, but I can't process your question right now. Please try again later."
             }
 
+    def embed(self, text: str) -> Optional[List[float]]:
+        """
+        Embed a short text, such as a user question.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Embedding vector, or None if embeddings are unavailable
+        """
+        if not self.openai_client or not text:
+            return None
+
+        try:
+            response = self.openai_client.embeddings.create(model=EMBEDDING_MODEL, input=text)
+            return response.data[0].embedding
+        except Exception as e:
+            print(f"Error embedding text: {str(e)}")
+            return None
+
     def search_transactions(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
         Search transactions using semantic similarity.
@@ -244,11 +302,7 @@ class FinanceAgent:
                         category_expenses[category] = 0
                     category_expenses[category] += txn.get("amount", 0)
 
-            top_categories = sorted(
-                category_expenses.items(),
-                key=lambda x: x[1],
-                reverse=True
-            )[:5]  # Top 5
+            top_categories = heapq.nlargest(5, category_expenses.items(), key=lambda x: x[1])  # Top 5
 
             # Return basic summary without AI-generated text
             fallback_message = ""
@@ -261,7 +315,7 @@ class FinanceAgent:
                 "total_income": total_income,
                 "total_expenses": total_expenses,
                 "net_cash_flow": net_cash_flow,
-                "top_expense_categories": [{"category": cat, "amount": amt} for cat, amt in top_categories],
+                "top_expense_categories": tuple({"category": cat, "amount": amt} for cat, amt in top_categories),
                 "summary_text": fallback_message
             }
 
@@ -327,29 +381,21 @@ class FinanceAgent:
                         # Sort by date
                         txns = sorted(txns, key=lambda x: x.get("date", ""))
 
-                        # Calculate average amount
-                        amounts = [t.get("amount", 0) for t in txns]
-                        avg_amount = sum(amounts) / len(amounts)
-
-                        # Calculate average days between transactions
-                        dates = []
-                        for t in txns:
-                            date_str = t.get("date", "")
-                            if date_str:
-                                try:
-                                    date_obj = datetime.datetime.strptime(date_str, "%Y-%m-%d")
-                                    dates.append(date_obj)
-                                except:
-                                    pass
+                        # Vectorize amounts and dates once
+                        amounts = np.asarray([t.get("amount", 0) for t in txns], dtype=np.float64)
+                        try:
+                            dates = np.asarray([t["date"] for t in txns if t.get("date")], dtype="datetime64[D]")
+                        except ValueError:
+                            continue
 
                         if len(dates) >= 2:
-                            # Calculate day differences
-                            diffs = [(dates[i+1] - dates[i]).days for i in range(len(dates)-1)]
-                            avg_diff = sum(diffs) / len(diffs)
+                            # Calculate average amount and days between transactions
+                            avg_amount, avg_diff = _recurrence_stats(dates, amounts)
 
                             # If seems to be monthly (25-35 days)
                             if 25 <= avg_diff <= 35:
-                                next_date = dates[-1] + datetime.timedelta(days=30)
+                                last_date = dates[-1].astype(datetime.date)
+                                next_date = datetime.datetime.combine(last_date, datetime.time()) + datetime.timedelta(days=30)
 
                                 # Only add if in the future
                                 if next_date > today:
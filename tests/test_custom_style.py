@@ -0,0 +1,24 @@
+import textwrap
+
+import pytest
+
+pytest.importorskip("streamlit")
+
+from utils.custom_style import retro_metric_grid
+
+
+def test_metric_grid_without_delta_has_no_blank_lines():
+    html = retro_metric_grid([
+        {"label": "Balance", "value": "$10.00", "delta": None},
+        {"label": "Savings Rate", "value": "12.0%", "delta": "+1.5%"},
+    ])
+
+    lines = textwrap.dedent(html).splitlines()
+    assert all(line.strip() for line in lines)
+    assert not any(line.startswith("    ") for line in lines)
+
+
+def test_metric_grid_renders_delta():
+    html = retro_metric_grid([{"label": "Income", "value": "$5.00", "delta": "-2%"}])
+
+    assert "▼ -2%" in html
@@ -11,6 +11,7 @@ from utils.custom_style import (
     badge,
     neon_text,
     retro_metric,
+    retro_metric_grid,
     animated_progress,
     format_currency,
     retro_table,
@@ -2,6 +2,7 @@
 """
 Custom styling for the finance application with retro/cyberpunk UI elements.
 """
+import html
 import streamlit as st
 
 def inject_custom_css():
@@ -52,6 +53,32 @@ def retro_metric(label, value, delta=None, delta_color="normal"):
     """Create a metric using Streamlit's metric component."""
     st.metric(label=label, value=value, delta=delta)
 
+def _metric_delta(metric):
+    """Build the delta line for a metric in the grid."""
+    delta = metric.get("delta")
+    if delta is None:
+        return ""
+    positive = not str(delta).startswith("-")
+    color = "#2ECC71" if positive else "#E74C3C"
+    arrow = "▲" if positive else "▼"
+    return f"<div style='color: {color}; font-size: 0.85rem;'>{arrow} {html.escape(str(delta))}</div>"
+
+def retro_metric_grid(metrics, columns=4):
+    """Build the HTML for a grid of metrics so it can be rendered in one call."""
+    # Each cell stays on one line; a blank or indented line would make Markdown render the rest as a code block
+    cells = "".join(
+        '<div style="padding: 8px 0;">'
+        f'<div style="font-size: 0.875rem; opacity: 0.8;">{html.escape(str(m["label"]))}</div>'
+        f'<div style="font-size: 2rem; line-height: 1.3;">{html.escape(str(m["value"]))}</div>'
+        f'{_metric_delta(m)}'
+        '</div>'
+        for m in metrics
+    )
+    return (
+        f'<div style="display: grid; grid-template-columns: repeat({columns}, minmax(0, 1fr)); gap: 20px 16px;">'
+        f'{cells}</div>'
+    )
+
 def animated_progress(percent, label=""):
     """Create a progress bar using Streamlit."""
     st.progress(percent/100)
@@ -5,6 +5,35 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 
+# Common budget categories
+budget_categories = [
+    "Housing & Utilities",
+    "Groceries & Food",
+    "Transportation",
+    "Healthcare",
+    "Insurance",
+    "Entertainment",
+    "Shopping",
+    "Personal Care",
+    "Education",
+    "Savings",
+    "Investments",
+    "Emergency Fund",
+    "Debt Payments",
+    "Subscriptions",
+    "Travel",
+    "Gifts & Donations",
+    "Home Maintenance",
+    "Pet Expenses",
+    "Hobbies",
+    "Dining Out",
+    "Fitness & Health",
+    "Electronics",
+    "Clothing",
+    "Children Expenses",
+    "Professional Development"
+]
+
 def get_date_range(period: str) -> Tuple[str, str]:
     """
     Get date range for a specific period.
@@ -86,35 +115,6 @@ def get_recommendations(transactions: List[Dict[str, Any]]) -> List[str]:
             elif savings_rate > 0.2:
                 recommendations.append("Great job saving! Consider investing some of your savings for long-term growth.")
     
-    # Common budget categories
-    budget_categories = [
-        "Housing & Utilities",
-        "Groceries & Food",
-        "Transportation",
-        "Healthcare",
-        "Insurance",
-        "Entertainment",
-        "Shopping",
-        "Personal Care",
-        "Education",
-        "Savings",
-        "Investments",
-        "Emergency Fund",
-        "Debt Payments",
-        "Subscriptions",
-        "Travel",
-        "Gifts & Donations",
-        "Home Maintenance",
-        "Pet Expenses",
-        "Hobbies",
-        "Dining Out",
-        "Fitness & Health",
-        "Electronics",
-        "Clothing",
-        "Children Expenses",
-        "Professional Development"
-    ]
-
     # Add some general recommendations
     general_recs = [
         {"type": "Cost Optimization", "tip": "Review subscriptions monthly to eliminate unused services."},
@@ -217,7 +217,7 @@ def create_spending_trend_chart(daily_spending: Dict[str, float]):
     
     # Convert to DataFrame
     df = pd.DataFrame({
-        'date': pd.to_datetime(list(daily_spending.keys())),
+        'date': pd.to_datetime(list(daily_spending.keys()), format="%Y-%m-%d", cache=True),
         'amount': list(daily_spending.values())
     })
     
@@ -230,12 +230,13 @@ def create_spending_trend_chart(daily_spending: Dict[str, float]):
         x='date',
         y='amount',
         title="Daily Spending Trend",
-        markers=True
+        markers=True,
+        render_mode='webgl'
     )
     
     # Add area below line
     fig.add_trace(
-        go.Scatter(
+        go.Scattergl(
             x=df['date'],
             y=df['amount'],
             mode='none',
@@ -256,6 +257,7 @@ def create_spending_trend_chart(daily_spending: Dict[str, float]):
         paper_bgcolor='rgba(0,0,0,0)',
         plot_bgcolor='rgba(0,0,0,0)',
         margin=dict(t=40, b=20, l=20, r=20),
+        uirevision='fixed',
         xaxis=dict(
             showgrid=True,
             gridcolor='rgba(147, 112, 219, 0.1)',
@@ -288,7 +290,7 @@ def create_balance_chart(transactions: List[Dict[str, Any]]):
     df = pd.DataFrame(transactions)
     
     # Ensure date is datetime and sort
-    df['date'] = pd.to_datetime(df['date'])
+    df['date'] = pd.to_datetime(df['date'], format="%Y-%m-%d", cache=True)
     df = df.sort_values('date')
     
     # Calculate running balance
@@ -304,7 +306,8 @@ def create_balance_chart(transactions: List[Dict[str, Any]]):
         x='date',
         y='balance',
         title="Account Balance Over Time",
-        markers=True
+        markers=True,
+        render_mode='webgl'
     )
     
     # Custom styling
@@ -328,45 +331,33 @@ def create_balance_chart(transactions: List[Dict[str, Any]]):
     )
     
     # Shade area below zero in red, above zero in green
-    for i, row in df.iterrows():
-        if i == 0:
-            continue
-        
-        prev_balance = df.iloc[i-1]['balance']
-        curr_balance = row['balance']
-        prev_date = df.iloc[i-1]['date']
-        curr_date = row['date']
-        
-        if prev_balance <= 0 and curr_balance <= 0:
-            # Both points below zero - red
-            fig.add_trace(
-                go.Scatter(
-                    x=[prev_date, curr_date],
-                    y=[prev_balance, curr_balance],
-                    mode='none',
-                    fill='tozeroy',
-                    fillcolor='rgba(231, 76, 60, 0.2)',
-                    showlegend=False
-                )
-            )
-        elif prev_balance >= 0 and curr_balance >= 0:
-            # Both points above zero - green
-            fig.add_trace(
-                go.Scatter(
-                    x=[prev_date, curr_date],
-                    y=[prev_balance, curr_balance],
-                    mode='none',
-                    fill='tozeroy',
-                    fillcolor='rgba(46, 204, 113, 0.2)',
-                    showlegend=False
-                )
-            )
+    fig.add_trace(
+        go.Scattergl(
+            x=df['date'],
+            y=df['balance'].clip(upper=0),
+            mode='none',
+            fill='tozeroy',
+            fillcolor='rgba(231, 76, 60, 0.2)',
+            showlegend=False
+        )
+    )
+    fig.add_trace(
+        go.Scattergl(
+            x=df['date'],
+            y=df['balance'].clip(lower=0),
+            mode='none',
+            fill='tozeroy',
+            fillcolor='rgba(46, 204, 113, 0.2)',
+            showlegend=False
+        )
+    )
     
     fig.update_layout(
         font=dict(color='white'),
         paper_bgcolor='rgba(0,0,0,0)',
         plot_bgcolor='rgba(0,0,0,0)',
         margin=dict(t=40, b=20, l=20, r=20),
+        uirevision='fixed',
         xaxis=dict(
             showgrid=True,
             gridcolor='rgba(147, 112, 219, 0.1)',
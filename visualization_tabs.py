@@ -2,7 +2,7 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from typing import Dict, List, Any, Callable
+from typing import Dict, List, Any, Callable, Optional
 import datetime
 
 from utils import format_currency
@@ -13,13 +13,200 @@ from db_manager import (
 )
 import db_service as db
 
-def create_tabbed_charts(user_id: str, time_period: str = "month"):
+@st.cache_data(ttl=300, max_entries=64, show_spinner=False)
+def _income_expense_chart(user_id: str, start_date: Optional[str], period_name: str, data_version: int = 0):
+    """Build the monthly income vs. expense figure and its plot rows."""
+    # Get date, type and amount rows, filtered by date in the database
+    rows = db.get_transaction_rows(user_id, start_date)
+    
+    # Group by month and type
+    monthly_data = {}
+    for date, txn_type, amount in rows:
+        if not date:
+            continue
+            
+        # Get month and year
+        month_year = datetime.datetime.strptime(date, "%Y-%m-%d").strftime("%b %Y")
+        
+        # Initialize if not exists
+        if month_year not in monthly_data:
+            monthly_data[month_year] = {"income": 0, "expense": 0}
+        
+        # Add to appropriate category
+        txn_type = (txn_type or 'expense').lower()
+        amount = amount or 0
+        
+        if txn_type == 'income':
+            monthly_data[month_year]['income'] += amount
+        else:
+            monthly_data[month_year]['expense'] += amount
+    
+    # Convert to dataframe for plotting
+    plot_data = []
+    for month, values in monthly_data.items():
+        plot_data.append({
+            "Month": month,
+            "Income": values["income"],
+            "Expense": values["expense"],
+            "Net": values["income"] - values["expense"]
+        })
+    
+    # Sort by date
+    if plot_data:
+        try:
+            # Get a list of month names sorted by date
+            months = sorted(list(monthly_data.keys()), 
+                          key=lambda x: datetime.datetime.strptime(x, "%b %Y"))
+            
+            # Sort plot data by this order
+            plot_data = sorted(plot_data, key=lambda x: months.index(x["Month"]))
+        except:
+            # Fallback if there's an issue with sorting
+            pass
+    
+    # Create plot
+    if not plot_data:
+        return None, plot_data
+    
+    df = pd.DataFrame(plot_data)
+    
+    # Create a grouped bar chart
+    fig = go.Figure()
+    
+    # Add income bars
+    fig.add_trace(go.Bar(
+        x=df["Month"],
+        y=df["Income"],
+        name="Income",
+        marker_color='green'
+    ))
+    
+    # Add expense bars
+    fig.add_trace(go.Bar(
+        x=df["Month"],
+        y=df["Expense"],
+        name="Expense",
+        marker_color='red'
+    ))
+    
+    # Add net line
+    fig.add_trace(go.Scatter(
+        x=df["Month"],
+        y=df["Net"],
+        name="Net",
+        mode='lines+markers',
+        line=dict(color='blue', width=2),
+        marker=dict(size=8)
+    ))
+    
+    # Update layout
+    fig.update_layout(
+        title=f"Income vs. Expense by Month ({period_name})",
+        xaxis_title="Month",
+        yaxis_title="Amount ($)",
+        barmode='group',
+        hovermode="x unified",
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
+        )
+    )
+    
+    # Add hover templates with formatted currency
+    fig.update_traces(
+        hovertemplate="%{y:$,.2f}",
+        selector=dict(type="bar")
+    )
+    
+    fig.update_traces(
+        hovertemplate="%{y:$,.2f}",
+        selector=dict(type="scatter")
+    )
+    
+    return fig, plot_data
+
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def _category_pie_chart(df: pd.DataFrame, period_name: str):
+    """Build the spending-by-category pie chart."""
+    # Create pie chart
+    fig = px.pie(
+        df,
+        values="Amount",
+        names="Category",
+        title=f"Spending by Category ({period_name})",
+        hole=0.4,
+        color_discrete_sequence=px.colors.qualitative.Bold
+    )
+    
+    fig.update_traces(
+        textposition="inside",
+        textinfo="percent+label",
+        hovertemplate="%{label}: %{value:$,.2f} (%{percent})"
+    )
+    
+    fig.update_layout(
+        showlegend=True,
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=-0.2,
+            xanchor="center",
+            x=0.5
+        )
+    )
+    
+    return fig
+
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def _daily_spending_chart(df: pd.DataFrame, period_name: str):
+    """Build the daily spending line chart with its 7-day moving average."""
+    # Create line chart
+    fig = px.line(
+        df,
+        x="Date",
+        y="Amount",
+        title=f"Daily Spending ({period_name})",
+        markers=True
+    )
+    
+    # Update layout
+    fig.update_layout(
+        xaxis_title="Date",
+        yaxis_title="Amount ($)",
+        hovermode="x unified"
+    )
+    
+    # Add hover template with formatted currency
+    fig.update_traces(
+        hovertemplate="%{y:$,.2f}"
+    )
+    
+    # Adding a moving average trendline (7-day)
+    if len(df) > 7:
+        df_with_ma = df.copy()
+        df_with_ma["Moving_Avg"] = df["Amount"].rolling(window=7).mean()
+        
+        fig.add_scatter(
+            x=df_with_ma["Date"],
+            y=df_with_ma["Moving_Avg"],
+            mode="lines",
+            name="7-Day Average",
+            line=dict(color="red", width=1, dash="dash")
+        )
+    
+    return fig
+
+def create_tabbed_charts(user_id: str, time_period: str = "month", data_version: int = 0):
     """
     Create a tabbed interface for visualizing financial data with different chart types.
     
     Args:
         user_id (str): The user ID
         time_period (str): Time period for filtering data ("week", "month", "year", "all")
+        data_version (int): Version of the user's data, used to invalidate cached charts
     """
     # Define the tabs
     tab1, tab2, tab3 = st.tabs(["Income vs Expense", "Spending by Category", "Daily Spending"])
@@ -47,120 +234,9 @@ def create_tabbed_charts(user_id: str, time_period: str = "month"):
     with tab1:
         st.subheader(f"Income vs Expense ({period_name})")
         
-        # Get transactions
-        transactions = db.get_transactions(user_id)
-        txn_dicts = [t.to_dict() for t in transactions]
-        
-        # Filter by date if needed
-        if start_date:
-            txn_dicts = [t for t in txn_dicts if t.get('date', '') >= start_date]
-        
-        # Group by month and type
-        monthly_data = {}
-        for txn in txn_dicts:
-            date = txn.get('date', '')
-            if not date:
-                continue
-                
-            # Get month and year
-            month_year = datetime.datetime.strptime(date, "%Y-%m-%d").strftime("%b %Y")
-            
-            # Initialize if not exists
-            if month_year not in monthly_data:
-                monthly_data[month_year] = {"income": 0, "expense": 0}
-            
-            # Add to appropriate category
-            txn_type = txn.get('type', 'expense').lower()
-            amount = txn.get('amount', 0)
-            
-            if txn_type == 'income':
-                monthly_data[month_year]['income'] += amount
-            else:
-                monthly_data[month_year]['expense'] += amount
-        
-        # Convert to dataframe for plotting
-        plot_data = []
-        for month, values in monthly_data.items():
-            plot_data.append({
-                "Month": month,
-                "Income": values["income"],
-                "Expense": values["expense"],
-                "Net": values["income"] - values["expense"]
-            })
-        
-        # Sort by date
-        if plot_data:
-            try:
-                # Get a list of month names sorted by date
-                months = sorted(list(monthly_data.keys()), 
-                              key=lambda x: datetime.datetime.strptime(x, "%b %Y"))
-                
-                # Sort plot data by this order
-                plot_data = sorted(plot_data, key=lambda x: months.index(x["Month"]))
-            except:
-                # Fallback if there's an issue with sorting
-                pass
+        fig, plot_data = _income_expense_chart(user_id, start_date, period_name, data_version)
         
-        # Create plot
-        if plot_data:
-            df = pd.DataFrame(plot_data)
-            
-            # Create a grouped bar chart
-            fig = go.Figure()
-            
-            # Add income bars
-            fig.add_trace(go.Bar(
-                x=df["Month"],
-                y=df["Income"],
-                name="Income",
-                marker_color='green'
-            ))
-            
-            # Add expense bars
-            fig.add_trace(go.Bar(
-                x=df["Month"],
-                y=df["Expense"],
-                name="Expense",
-                marker_color='red'
-            ))
-            
-            # Add net line
-            fig.add_trace(go.Scatter(
-                x=df["Month"],
-                y=df["Net"],
-                name="Net",
-                mode='lines+markers',
-                line=dict(color='blue', width=2),
-                marker=dict(size=8)
-            ))
-            
-            # Update layout
-            fig.update_layout(
-                title=f"Income vs. Expense by Month ({period_name})",
-                xaxis_title="Month",
-                yaxis_title="Amount ($)",
-                barmode='group',
-                hovermode="x unified",
-                legend=dict(
-                    orientation="h",
-                    yanchor="bottom",
-                    y=1.02,
-                    xanchor="right",
-                    x=1
-                )
-            )
-            
-            # Add hover templates with formatted currency
-            fig.update_traces(
-                hovertemplate="%{y:$,.2f}",
-                selector=dict(type="bar")
-            )
-            
-            fig.update_traces(
-                hovertemplate="%{y:$,.2f}",
-                selector=dict(type="scatter")
-            )
-            
+        if fig is not None:
             st.plotly_chart(fig, use_container_width=True)
             
             # Summary metrics
@@ -197,32 +273,7 @@ def create_tabbed_charts(user_id: str, time_period: str = "month"):
             # Sort by amount (descending)
             df = df.sort_values("Amount", ascending=False)
             
-            # Create pie chart
-            fig = px.pie(
-                df,
-                values="Amount",
-                names="Category",
-                title=f"Spending by Category ({period_name})",
-                hole=0.4,
-                color_discrete_sequence=px.colors.qualitative.Bold
-            )
-            
-            fig.update_traces(
-                textposition="inside",
-                textinfo="percent+label",
-                hovertemplate="%{label}: %{value:$,.2f} (%{percent})"
-            )
-            
-            fig.update_layout(
-                showlegend=True,
-                legend=dict(
-                    orientation="h",
-                    yanchor="bottom",
-                    y=-0.2,
-                    xanchor="center",
-                    x=0.5
-                )
-            )
+            fig = _category_pie_chart(df, period_name)
             
             st.plotly_chart(fig, use_container_width=True)
             
@@ -251,7 +302,7 @@ def create_tabbed_charts(user_id: str, time_period: str = "month"):
             })
             
             # Parse dates
-            df["Date"] = pd.to_datetime(df["Date"])
+            df["Date"] = pd.to_datetime(df["Date"], format="%Y-%m-%d", cache=True)
             
             # Sort by date
             df = df.sort_values("Date")
@@ -259,39 +310,7 @@ def create_tabbed_charts(user_id: str, time_period: str = "month"):
             # Format date for display
             df["Date"] = df["Date"].dt.strftime("%b %d, %Y")
             
-            # Create line chart
-            fig = px.line(
-                df,
-                x="Date",
-                y="Amount",
-                title=f"Daily Spending ({period_name})",
-                markers=True
-            )
-            
-            # Update layout
-            fig.update_layout(
-                xaxis_title="Date",
-                yaxis_title="Amount ($)",
-                hovermode="x unified"
-            )
-            
-            # Add hover template with formatted currency
-            fig.update_traces(
-                hovertemplate="%{y:$,.2f}"
-            )
-            
-            # Adding a moving average trendline (7-day)
-            if len(df) > 7:
-                df_with_ma = df.copy()
-                df_with_ma["Moving_Avg"] = df["Amount"].rolling(window=7).mean()
-                
-                fig.add_scatter(
-                    x=df_with_ma["Date"],
-                    y=df_with_ma["Moving_Avg"],
-                    mode="lines",
-                    name="7-Day Average",
-                    line=dict(color="red", width=1, dash="dash")
-                )
+            fig = _daily_spending_chart(df, period_name)
             
             st.plotly_chart(fig, use_container_width=True)
             